@@ -10,16 +10,30 @@ Authentication behavior:
 - External API calls require Basic Auth headers
 """
 
+import hashlib
+import hmac
+import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
 from functools import wraps
-from flask import session, request
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from flask import Response, session, request
 from flask_httpauth import HTTPBasicAuth
-from werkzeug.security import check_password_hash, generate_password_hash
+from werkzeug.security import check_password_hash
 import logging
 
 logger = logging.getLogger(__name__)
 
-auth = HTTPBasicAuth()
+# argon2id is used for new password hashes. Legacy werkzeug (pbkdf2/scrypt)
+# hashes are still verified.
+_argon2_hasher = PasswordHasher(time_cost=3, memory_cost=4096, parallelism=1)
+
+auth = HTTPBasicAuth(realm="MarketApp")
 
 
 # Load credentials from environment variables
@@ -31,28 +45,190 @@ API_PASSWORD = os.environ.get("API_PASSWORD")
 API_PASSWORD_HASH = os.environ.get("API_PASSWORD_HASH")
 
 
-def _verify_credentials(username, password):
+
+class _AuthMode(Enum):
+    """How passwords are checked, decided once from the configured credentials."""
+    DISABLED = "disabled"
+    HASHED = "hashed"
+    PLAIN = "plain"
+
+
+# Credentials are fixed for the life of the process, so the mode and the
+# expected digests are computed once instead of on every request
+if not API_USERNAME or not (API_PASSWORD_HASH or API_PASSWORD):
+    _AUTH_MODE = _AuthMode.DISABLED
+elif API_PASSWORD_HASH:
+    _AUTH_MODE = _AuthMode.HASHED
+else:
+    _AUTH_MODE = _AuthMode.PLAIN
+
+_AUTH_CONFIGURED = _AUTH_MODE is not _AuthMode.DISABLED
+
+# Successful hash verifications are cached briefly so repeat Basic Auth
+# requests skip the (deliberately slow) key derivation function.
+# Entries are keyed by a keyed HMAC of the credentials, never the raw password.
+AUTH_CACHE_TTL_SECONDS = float(os.environ.get("AUTH_CACHE_TTL_SECONDS", "300"))
+AUTH_CACHE_MAX_ENTRIES = 1024
+
+_auth_cache_secret = os.urandom(32)
+_auth_cache = OrderedDict()  # credential digest -> expiry (time.monotonic)
+_auth_cache_lock = threading.Lock()
+
+# Successful Basic Auth logins are counted and only every Nth is logged at
+# INFO, so a busy API client does not produce one log line per request.
+AUTH_SUCCESS_LOG_EVERY = 4096
+_auth_success_count = 0
+_auth_success_lock = threading.Lock()
+
+
+def _parse_werkzeug_hash(password_hash):
     """
-    Internal function to verify credentials.
+    Pre-parse a werkzeug "pbkdf2:<hash>:<iterations>" or "scrypt:<n>:<r>:<p>" hash.
+    
+    Mirrors werkzeug's own derivation so the result verifies identically to
+    check_password_hash.
     
     Returns:
-        True if credentials are valid, False otherwise
+        (derive, expected_digest) where derive(password_bytes) returns the raw
+        digest, or None for any other format (argon2, abbreviated methods, ...)
     """
-    if not API_USERNAME:
-        return False
+    try:
+        method, salt, hashval = password_hash.split("$", 2)
+        kind, *args = method.split(":")
+        salt_bytes = salt.encode("utf-8")
+        expected = bytes.fromhex(hashval)
+        
+        if kind == "pbkdf2" and len(args) == 2:
+            hash_name, iterations = args[0], int(args[1])
+            return (
+                lambda password: hashlib.pbkdf2_hmac(hash_name, password, salt_bytes, iterations),
+                expected,
+            )
+        if kind == "scrypt" and len(args) == 3:
+            n, r, p = map(int, args)
+            maxmem = 132 * n * r * p
+            return (
+                lambda password: hashlib.scrypt(password, salt=salt_bytes, n=n, r=r, p=p, maxmem=maxmem),
+                expected,
+            )
+    except ValueError:
+        pass
+    return None
+
+
+# API_PASSWORD_HASH is parsed once so verification can call hashlib directly
+# instead of re-splitting and re-decoding the stored hash on every check
+_PARSED_PASSWORD_HASH = _parse_werkzeug_hash(API_PASSWORD_HASH) if API_PASSWORD_HASH else None
+
+
+def _credential_fingerprint(value):
+    """Reduce a credential to a fixed-length SHA-256 digest for comparison."""
+    return hashlib.sha256((value or "").encode("utf-8")).digest()
+
+
+# Expected credential digests for _secure_compare, reduced the same way as
+# the values clients supply
+_USERNAME_DIGEST = _credential_fingerprint(API_USERNAME)
+_PASSWORD_DIGEST = _credential_fingerprint(API_PASSWORD)
+
+
+def _secure_compare(provided, expected):
+    """
+    Compare a client-supplied credential against the configured value.
     
-    if username != API_USERNAME:
-        return False
+    Both sides are reduced to 32-byte SHA-256 digests and compared with
+    hmac.compare_digest, CPython's C-level constant-time comparison. Because
+    the inputs always have the same length, the timing reveals neither how
+    many leading characters matched nor how long the configured value is.
+    Every check of a secret-derived value in this module should go through
+    here (or a KDF verify) rather than == / !=.
     
-    # Check hashed password first (more secure)
-    if API_PASSWORD_HASH:
-        return check_password_hash(API_PASSWORD_HASH, password)
+    Args:
+        provided: Value supplied by the client (may be None)
+        expected: Configured value, already reduced with _credential_fingerprint
     
-    # Fall back to plain password
-    if API_PASSWORD:
-        return password == API_PASSWORD
+    Returns:
+        True if the values are equal, False otherwise
+    """
+    return hmac.compare_digest(_credential_fingerprint(provided), expected)
+
+
+def _check_password_hash(password_hash, password):
+    """
+    Check a password against a stored hash of any supported format.
+    
+    Hashes starting with "$argon2" are verified with argon2-cffi; anything
+    else is handed to werkzeug's check_password_hash.
+    
+    Returns:
+        True if the password matches, False otherwise
+    """
+    if password_hash.startswith("$argon2"):
+        try:
+            return _argon2_hasher.verify(password_hash, password or "")
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password or "")
+
+
+def _check_configured_password_hash(password):
+    """Check a password against API_PASSWORD_HASH."""
+    if _PARSED_PASSWORD_HASH is None:
+        return _check_password_hash(API_PASSWORD_HASH, password)
     
-    return False
+    derive, expected = _PARSED_PASSWORD_HASH
+    return hmac.compare_digest(derive((password or "").encode("utf-8")), expected)
+
+
+def _credential_digest(username, password):
+    """Derive the cache key for a username/password pair."""
+    message = (username or "").encode("utf-8") + b"\0" + (password or "").encode("utf-8")
+    return hmac.new(_auth_cache_secret, message, hashlib.sha256).digest()
+
+
+def _check_password_hash_cached(username, password):
+    """
+    Verify password against API_PASSWORD_HASH, reusing recent successes.
+    
+    Only successful verifications are cached, so a wrong password always
+    pays the full hash cost and cannot fill the cache.
+    
+    Returns:
+        True if the password matches the configured hash, False otherwise
+    """
+    digest = _credential_digest(username, password)
+    now = time.monotonic()
+    
+    with _auth_cache_lock:
+        expires_at = _auth_cache.get(digest)
+        if expires_at is not None:
+            if expires_at > now:
+                _auth_cache.move_to_end(digest)
+                return True
+            del _auth_cache[digest]
+    
+    if not _check_configured_password_hash(password):
+        return False
+    
+    if AUTH_CACHE_TTL_SECONDS > 0:
+        with _auth_cache_lock:
+            _auth_cache[digest] = now + AUTH_CACHE_TTL_SECONDS
+            _auth_cache.move_to_end(digest)
+            while len(_auth_cache) > AUTH_CACHE_MAX_ENTRIES:
+                _auth_cache.popitem(last=False)
+    return True
+
+
+def invalidate_auth_cache():
+    """
+    Drop all cached credential verifications.
+    
+    For tests and admin hooks that need the next request to pay the full
+    hash check. Credentials are read once at import, so rotating
+    API_PASSWORD_HASH needs a restart, which starts with an empty cache.
+    """
+    with _auth_cache_lock:
+        _auth_cache.clear()
 
 
 @auth.verify_password
@@ -72,45 +248,59 @@ def verify_password(username, password):
     Returns:
         True if authentication succeeds, False otherwise
     """
+    global _auth_success_count
+    
     # First check if user has a valid session (from dashboard login)
     if session.get('authenticated'):
         logger.debug("User authenticated via session")
         return True
     
-    if not API_USERNAME:
-        logger.warning("API_USERNAME not configured. Authentication disabled!")
+    if _AUTH_MODE is _AuthMode.DISABLED:
+        if not API_USERNAME:
+            logger.warning("API_USERNAME not configured. Authentication disabled!")
+        else:
+            logger.error("Neither API_PASSWORD nor API_PASSWORD_HASH is configured!")
         return False
     
-    if username != API_USERNAME:
-        logger.warning(f"Authentication failed: Invalid username '{username}'")
+    if not _secure_compare(username, _USERNAME_DIGEST):
+        logger.warning("Authentication failed: Invalid username '%s'", username)
         return False
     
-    # Check hashed password first (more secure)
-    if API_PASSWORD_HASH:
-        if check_password_hash(API_PASSWORD_HASH, password):
-            logger.info(f"User '{username}' authenticated successfully (hashed)")
-            # Store auth in session for subsequent requests
-            session['authenticated'] = True
-            session['username'] = username
-            return True
-        else:
-            logger.warning(f"Authentication failed: Invalid password for user '{username}'")
-            return False
+    # Hashed password takes precedence over plain (more secure)
+    if _AUTH_MODE is _AuthMode.HASHED:
+        authenticated = _check_password_hash_cached(username, password)
+    else:
+        authenticated = _secure_compare(password, _PASSWORD_DIGEST)
     
-    # Fall back to plain password (simpler but less secure)
-    if API_PASSWORD:
-        if password == API_PASSWORD:
-            logger.info(f"User '{username}' authenticated successfully (plain)")
-            # Store auth in session for subsequent requests
-            session['authenticated'] = True
-            session['username'] = username
-            return True
-        else:
-            logger.warning(f"Authentication failed: Invalid password for user '{username}'")
-            return False
+    if not authenticated:
+        logger.warning("Authentication failed: Invalid password for user '%s'", username)
+        return False
     
-    logger.error("Neither API_PASSWORD nor API_PASSWORD_HASH is configured!")
-    return False
+    with _auth_success_lock:
+        _auth_success_count += 1
+        successes = _auth_success_count
+    if successes == 1 or successes % AUTH_SUCCESS_LOG_EVERY == 0:
+        logger.info("User '%s' authenticated successfully (%s), %d successful logins so far",
+                    username, _AUTH_MODE.value, successes)
+    else:
+        logger.debug("User '%s' authenticated successfully (%s)", username, _AUTH_MODE.value)
+    # Store auth in session for subsequent requests
+    session['authenticated'] = True
+    session['username'] = username
+    return True
+
+
+def _auth_error_body(status):
+    """Serialize the JSON body returned for an authentication failure."""
+    return json.dumps({
+        "error": "Unauthorized",
+        "message": "Authentication required. Please provide valid credentials.",
+        "status": status
+    }, separators=(",", ":"))
+
+
+# The 401 body never changes, so it is serialized once
+_UNAUTHORIZED_BODY = _auth_error_body(401)
 
 
 @auth.error_handler
@@ -121,11 +311,25 @@ def auth_error(status):
     Returns:
         JSON response with error message
     """
-    return {
-        "error": "Unauthorized",
-        "message": "Authentication required. Please provide valid credentials.",
-        "status": status
-    }, status
+    body = _UNAUTHORIZED_BODY if status == 401 else _auth_error_body(status)
+    response = Response(body, status=status, mimetype="application/json")
+    # Auth failures must never be cached by browsers or proxies, and the
+    # outcome depends on the credentials sent
+    response.headers["Cache-Control"] = "no-store"
+    response.vary.add("Authorization")
+    return response
+
+
+def auth_success_count():
+    """
+    Get the number of successful Basic Auth logins since the process started.
+    
+    Session-authenticated requests are not counted.
+    
+    Returns:
+        Count of successful credential checks
+    """
+    return _auth_success_count
 
 
 def is_auth_configured():
@@ -135,13 +339,15 @@ def is_auth_configured():
     Returns:
         True if auth credentials are set, False otherwise
     """
-    return bool(API_USERNAME and (API_PASSWORD or API_PASSWORD_HASH))
+    return _AUTH_CONFIGURED
 
 
 def get_password_hash(password):
     """
     Generate a password hash for storing in Kubernetes secrets.
     
+    Produces an argon2id hash.
+    
     Usage:
         python -c "from auth import get_password_hash; print(get_password_hash('your_password'))"
     
@@ -151,4 +357,22 @@ def get_password_hash(password):
     Returns:
         Password hash string
     """
-    return generate_password_hash(password)
+    return _argon2_hasher.hash(password)
+
+
+def get_password_hashes(passwords, max_workers=None):
+    """
+    Hash many passwords in parallel, e.g. when seeding several users.
+    
+    Each hash is CPU-bound and independent, so they are spread across a
+    process pool (one single-threaded hash per worker).
+    
+    Args:
+        passwords: Iterable of plain text passwords
+        max_workers: Pool size (defaults to the number of CPUs)
+    
+    Returns:
+        List of password hash strings, in the same order as passwords
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_password_hash, passwords))
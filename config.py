@@ -6,14 +6,31 @@ Environment Variables:
     GOOGLE_SERVICE_ACCOUNT_FILE: Path to service account JSON file
     GOOGLE_SHEETS_SPREADSHEET_ID: Override default spreadsheet ID
     GOOGLE_SHEETS_SHEET_NAME: Override default sheet name
+    API_USERNAME / API_PASSWORD / API_PASSWORD_HASH: API authentication credentials
+    FLASK_DEBUG: Enable debug mode ("1", "true", "yes", "on")
+    HOST / PORT: Bind address for the development server
 """
 
 import os
-from dataclasses import dataclass
+import types
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+# Snapshot of the environment taken once at import. Every from_env() reads
+# this plain mapping, so all configs in a process see the same values.
+_ENV = types.MappingProxyType(dict(os.environ))
+
+# Accepted spellings for boolean-ish environment flags
+_DEBUG_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+# Server settings are parsed once at import rather than on every from_env()
+_DEBUG = _ENV.get("FLASK_DEBUG", "").lower() in _DEBUG_TRUTHY
+_HOST = _ENV.get("HOST", "0.0.0.0")
+_PORT = int(_ENV.get("PORT", "5000"))
+
+
+@dataclass(slots=True, frozen=True)
 class GoogleSheetsConfig:
     """Configuration for Google Sheets integration."""
     spreadsheet_id: str = "1lay4YEVMV6JDlP5rzdS8iegAFxpyoZakb502o7ZtqpA"
@@ -25,16 +42,16 @@ class GoogleSheetsConfig:
     def from_env(cls) -> "GoogleSheetsConfig":
         """Load configuration from environment variables."""
         return cls(
-            spreadsheet_id=os.environ.get(
+            spreadsheet_id=_ENV.get(
                 "GOOGLE_SHEETS_SPREADSHEET_ID",
                 "1lay4YEVMV6JDlP5rzdS8iegAFxpyoZakb502o7ZtqpA"
             ),
-            sheet_name=os.environ.get(
+            sheet_name=_ENV.get(
                 "GOOGLE_SHEETS_SHEET_NAME",
                 "Net Worth Tracking"
             ),
-            credentials_json=os.environ.get("GOOGLE_SERVICE_ACCOUNT_JSON"),
-            credentials_file=os.environ.get("GOOGLE_SERVICE_ACCOUNT_FILE"),
+            credentials_json=_ENV.get("GOOGLE_SERVICE_ACCOUNT_JSON"),
+            credentials_file=_ENV.get("GOOGLE_SERVICE_ACCOUNT_FILE"),
         )
     
     def is_configured(self) -> bool:
@@ -42,51 +59,44 @@ class GoogleSheetsConfig:
         return bool(self.credentials_json or self.credentials_file)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthConfig:
     """Configuration for API authentication."""
     username: Optional[str] = None
     password: Optional[str] = None
     password_hash: Optional[str] = None
     
-    auth: AuthConfig = None
-    
-    def __post_init__(self):
-        if self.google_sheets is None:
-            self.google_sheets = GoogleSheetsConfig.from_env()
-        if self.auth is None:
-            self.auth = AuthConfig.from_env()
-    
     @classmethod
-    def from_env(cls) -> "AppConfig":
+    def from_env(cls) -> "AuthConfig":
         """Load configuration from environment variables."""
         return cls(
-            debug=os.environ.get("FLASK_DEBUG", "").lower() in ("1", "true"),
-            host=os.environ.get("HOST", "0.0.0.0"),
-            port=int(os.environ.get("PORT", "5000")),
-            google_sheets=GoogleSheetsConfig.from_env(),
-            auth=Auth
+            username=_ENV.get("API_USERNAME"),
+            password=_ENV.get("API_PASSWORD"),
+            password_hash=_ENV.get("API_PASSWORD_HASH"),
+        )
+    
+    def is_configured(self) -> bool:
+        """Check if authentication credentials are configured."""
+        return bool(self.username and (self.password or self.password_hash))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Main application configuration."""
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 5000
-    google_sheets: GoogleSheetsConfig = None
-    
-    def __post_init__(self):
-        if self.google_sheets is None:
-            self.google_sheets = GoogleSheetsConfig.from_env()
+    # Sub-configs not passed in explicitly are read from the environment
+    google_sheets: GoogleSheetsConfig = field(default_factory=GoogleSheetsConfig.from_env)
+    auth: AuthConfig = field(default_factory=AuthConfig.from_env)
     
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Load configuration from environment variables."""
         return cls(
-            debug=os.environ.get("FLASK_DEBUG", "").lower() in ("1", "true"),
-            host=os.environ.get("HOST", "0.0.0.0"),
-            port=int(os.environ.get("PORT", "5000")),
-            google_sheets=GoogleSheetsConfig.from_env(),
+            debug=_DEBUG,
+            host=_HOST,
+            port=_PORT,
         )
 
 
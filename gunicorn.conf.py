@@ -0,0 +1,19 @@
+"""
+Gunicorn server hooks.
+
+Gunicorn loads this file from its working directory, so the Docker image
+picks it up without extra flags. Bind address, worker counts and timeouts
+stay on the command line in the Dockerfile.
+"""
+
+
+def post_worker_init(worker):
+    """Warm the dataset cache once a serving worker has loaded the app."""
+    try:
+        from services.google_sheets import NET_WORTH_PREFETCH, prefetch_net_worth_dataset
+    except ImportError as e:
+        worker.log.warning(f"Skipping net worth prefetch: {e}")
+        return
+    
+    if NET_WORTH_PREFETCH:
+        prefetch_net_worth_dataset()
@@ -1,17 +1,72 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from auth import auth, is_auth_configured
+import gzip
+import hashlib
 import logging
 import os
+import re
+import textwrap
+import zlib
+from bisect import bisect_left
+from datetime import date, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+
+import brotli
+import orjson
+
+# The Google Sheets client libraries are optional at import time; the data
+# endpoints report the missing dependency instead of failing app startup.
+try:
+    from services.google_sheets import get_cached_net_worth_dataset, GoogleSheetsError
+    _google_sheets_import_error = None
+except ImportError as e:
+    _google_sheets_import_error = e
+    
+    class GoogleSheetsError(Exception):
+        """Placeholder so handlers' except clauses resolve without the service."""
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson, falling back to Flask's default() for Decimal etc."""
+    
+    def _encode(self, obj, option=0):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | option)
+    
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Build the body from orjson's bytes directly instead of decoding to
+        # str for Response to encode straight back
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else args or kwargs or None
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        return self._app.response_class(self._encode(obj, option), mimetype=self.mimetype)
+
+
 app = Flask(__name__)
 
+app.json = _OrjsonProvider(app)
+
+# Response dicts are built in a deliberate order already; don't re-sort
+# every object's keys on each jsonify() call
+app.json.sort_keys = False
+
 # Configure secret key for session management
-# In production, this should be set via environment variable
-app.secret_key = os.environ.get("FLASK_SECRET_KEY", os.urandom(24))
+# In production, this should be set via environment variable; the random
+# fallback is only generated when it is missing and changes on every restart.
+app.secret_key = os.environ.get("FLASK_SECRET_KEY") or os.urandom(24)
 
 # Check authentication configuration on startup
 if is_auth_configured():
@@ -20,6 +75,253 @@ else:
     logger.warning("⚠ API authentication is NOT configured - API endpoints are unprotected!")
 
 
+# ============================================================================
+# Response Compression
+# ============================================================================
+
+# JSON responses at least this large are compressed on the fly
+_COMPRESS_MIN_BYTES = 1024
+# Fast settings for per-request compression (static assets use maximum levels)
+_DYNAMIC_BROTLI_QUALITY = 5
+_DYNAMIC_GZIP_LEVEL = 6
+_DYNAMIC_GZIP_WBITS = 16 + 13  # gzip container, 8KB window
+
+
+def _negotiate_encoding():
+    """Pick the content coding for a dynamic response: 'br', 'gzip' or None."""
+    if request.accept_encodings["br"]:
+        return "br"
+    if request.accept_encodings["gzip"]:
+        return "gzip"
+    return None
+
+
+def _compress_chunks(chunks, encoding):
+    """Compress an iterable of byte chunks incrementally with the given coding."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=_DYNAMIC_BROTLI_QUALITY)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(_DYNAMIC_GZIP_LEVEL, zlib.DEFLATED, _DYNAMIC_GZIP_WBITS)
+        compress, finish = compressor.compress, compressor.flush
+    
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+@app.after_request
+def _compress_response(response):
+    """Compress successful JSON responses for clients that accept it."""
+    if (
+        response.status_code != 200
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    
+    response.vary.add("Accept-Encoding")
+    encoding = _negotiate_encoding()
+    if encoding is None:
+        return response
+    
+    if response.is_streamed:
+        response.response = _compress_chunks(response.iter_encoded(), encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < _COMPRESS_MIN_BYTES:
+            return response
+        response.set_data(b"".join(_compress_chunks((data,), encoding)))
+    
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+# ============================================================================
+# HTTP Caching Helpers
+# ============================================================================
+
+# Browsers may reuse a data response this long before revalidating it
+_DATA_CACHE_CONTROL = "private, max-age=30"
+
+
+def _load_dataset():
+    """
+    Get the cached dataset for this request.
+    
+    With ?refresh=true the cached copy is skipped and the request waits for
+    a fresh Sheets load (shared with any other request already loading).
+    """
+    if request.args.get("refresh", "").lower() == "true":
+        return get_cached_net_worth_dataset(ttl=0, stale_ttl=0)
+    return get_cached_net_worth_dataset()
+
+
+def _dataset_etag(dataset):
+    """
+    Build an ETag for the current request's view of the dataset.
+    
+    It changes whenever a new dataset is loaded and differs per endpoint,
+    query string and content coding, since each of those is a different
+    representation.
+    """
+    version = dataset.last_updated.isoformat() if dataset.last_updated else ""
+    query = request.query_string.decode("latin-1")
+    key = f"{version}|{request.path}|{query}|{_negotiate_encoding()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _not_modified(dataset):
+    """
+    Short-circuit a conditional request whose cached copy is still current.
+    
+    Returns:
+        A 304 response if the client's If-None-Match matches the dataset,
+        otherwise None
+    """
+    etag = _dataset_etag(dataset)
+    if request.if_none_match.contains(etag):
+        return _with_cache_headers(Response(status=304), etag)
+    return None
+
+
+def _with_cache_headers(response, etag):
+    """
+    Attach the headers a 200 and its 304 must agree on (RFC 9110 §15.4.5).
+    
+    The ETag depends on the negotiated content coding and the data on the
+    credentials sent, so both are listed in Vary.
+    """
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = _DATA_CACHE_CONTROL
+    response.vary.update(("Accept-Encoding", "Authorization"))
+    return response
+
+
+def _with_validators(response, dataset):
+    """Attach ETag, Last-Modified, Cache-Control and Vary headers derived from the dataset."""
+    _with_cache_headers(response, _dataset_etag(dataset))
+    if dataset.last_updated:
+        response.last_modified = dataset.last_updated.astimezone(timezone.utc)
+    return response
+
+
+# Entries per chunk when streaming a JSON array of pre-serialized items
+_STREAM_BATCH_SIZE = 256
+
+
+def _stream_json_array(head, items, tail):
+    """
+    Yield a JSON document in chunks: head, the comma-joined items, then tail.
+    
+    Large responses go out as they are produced instead of first being
+    joined into one string.
+    """
+    yield head
+    for start in range(0, len(items), _STREAM_BATCH_SIZE):
+        if start:
+            yield ","
+        yield ",".join(items[start:start + _STREAM_BATCH_SIZE])
+    yield tail
+
+
+# ============================================================================
+# Chart Configuration
+# ============================================================================
+
+# Timeseries metric -> (label, line color, translucent fill)
+_METRIC_STYLES = {
+    metric: (label, color, color + "20")
+    for metric, label, color in (
+        ("net_worth", "Net Worth", "#667eea"),
+        ("investible_assets", "Investible Assets", "#28a745"),
+        ("semi_liquid_assets", "Semi-Liquid Assets", "#17a2b8"),
+        ("daily_net_worth_change", "Daily Change", "#ffc107"),
+    )
+}
+
+# Stacked trend series: (attribute, label, line color, translucent fill)
+_ACCOUNT_TREND_STYLES = tuple(
+    (attr, label, color, color + "80")
+    for attr, label, color in (
+        ("etrade", "E*TRADE", "#667eea"),
+        ("crypto", "Crypto", "#f7931a"),
+        ("fidelity", "Fidelity", "#4caf50"),
+        ("thinkorswim", "thinkorswim", "#00bcd4"),
+        ("tradestation", "TradeStation", "#9c27b0"),
+        ("capital_one", "Capital One", "#dc3545"),
+        ("nfts", "NFTs", "#e91e63"),
+        ("car", "Car", "#607d8b"),
+        ("misc", "Misc", "#795548"),
+        ("inheritance", "Inheritance", "#009688"),
+    )
+)
+
+# Allocation slice colors, assigned largest balance first
+_ALLOCATION_PALETTE = (
+    "#667eea", "#764ba2", "#28a745", "#17a2b8", "#ffc107",
+    "#dc3545", "#6f42c1", "#20c997", "#fd7e14", "#6c757d", "#e83e8c"
+)
+
+
+@lru_cache(maxsize=1)
+def _period_map(today):
+    """
+    Map chart period codes to their start dates ('all' has no start).
+    
+    Cached per day; the first call on a new day replaces the old entry.
+    """
+    return {
+        "1m": today - timedelta(days=30),
+        "3m": today - timedelta(days=90),
+        "6m": today - timedelta(days=180),
+        "1y": today - timedelta(days=365),
+        "ytd": today.replace(month=1, day=1),
+        "all": None
+    }
+
+
+def _m4_indices(xs, columns, width):
+    """
+    Pick the points M4 aggregation keeps for a line chart `width` pixels wide.
+    
+    The x range is split into `width` equal buckets; in each, the first and
+    last point are kept along with every column's minimum and maximum
+    (None values are skipped). Drawing only these points renders the same
+    pixels as drawing the whole series.
+    
+    Args:
+        xs: Ascending numeric x positions (e.g. date ordinals)
+        columns: Value lists aligned with xs
+        width: Number of pixel buckets
+    
+    Returns:
+        Sorted list of indices into xs to keep
+    """
+    x0 = xs[0]
+    span = (xs[-1] - x0) or 1
+    keep = set()
+    start = 0
+    while start < len(xs):
+        bucket = min(width - 1, (xs[start] - x0) * width // span)
+        if bucket == width - 1:
+            end = len(xs)
+        else:
+            end = bisect_left(xs, x0 + span * (bucket + 1) / width, start + 1)
+        keep.add(start)
+        keep.add(end - 1)
+        for column in columns:
+            present = [i for i in range(start, end) if column[i] is not None]
+            if present:
+                keep.add(min(present, key=column.__getitem__))
+                keep.add(max(present, key=column.__getitem__))
+        start = end
+    return sorted(keep)
+
+
 # ============================================================================
 # Net Worth API Endpoints
 # ============================================================================
@@ -38,69 +340,62 @@ def get_net_worth():
     Returns:
         JSON with net worth data and metadata
     """
-    from datetime import datetime
-    try:
-        from services.google_sheets import load_net_worth_from_sheets, GoogleSheetsError
-    except ImportError as e:
+    if _google_sheets_import_error is not None:
         return jsonify({
             "error": "Google Sheets dependencies not installed",
-            "details": str(e),
+            "details": str(_google_sheets_import_error),
             "hint": "Install with: pip install google-api-python-client google-auth"
         }), 500
     
     try:
-        dataset = load_net_worth_from_sheets()
+        dataset = _load_dataset()
+        not_modified = _not_modified(dataset)
+        if not_modified is not None:
+            return not_modified
         
         # Handle query parameters
         latest_only = request.args.get("latest", "").lower() == "true"
         start_date_str = request.args.get("start_date")
         end_date_str = request.args.get("end_date")
         
+        source = app.json.dumps({
+            "sheet_id": dataset.source_sheet_id,
+            "sheet_name": dataset.source_sheet_name,
+            "last_updated": dataset.last_updated.isoformat() if dataset.last_updated else None
+        })
+        
         if latest_only:
-            latest = dataset.get_latest_entry()
-            if latest:
-                return jsonify({
-                    "success": True,
-                    "data": latest.to_dict(),
-                    "source": {
-                        "sheet_id": dataset.source_sheet_id,
-                        "sheet_name": dataset.source_sheet_name,
-                        "last_updated": dataset.last_updated.isoformat() if dataset.last_updated else None
-                    }
-                })
+            if dataset.entries:
+                latest = dataset.entries_json[dataset.latest_index]
+                body = f'{{"success":true,"data":{latest},"source":{source}}}\n'
+                return _with_validators(Response(body, mimetype="application/json"), dataset)
             else:
                 return jsonify({"success": False, "error": "No data found"}), 404
         
-        # Apply date filters if provided
-        entries = dataset.entries
+        # Apply date filters if provided (a slice of the date-ordered entries)
+        start_date = end_date = None
         
         if start_date_str:
             try:
-                start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-                entries = [e for e in entries if e.date >= start_date]
+                start_date = date.fromisoformat(start_date_str)
             except ValueError:
                 return jsonify({"error": f"Invalid start_date format: {start_date_str}. Use YYYY-MM-DD"}), 400
         
         if end_date_str:
             try:
-                end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-                entries = [e for e in entries if e.date <= end_date]
+                end_date = date.fromisoformat(end_date_str)
             except ValueError:
                 return jsonify({"error": f"Invalid end_date format: {end_date_str}. Use YYYY-MM-DD"}), 400
         
-        # Sort by date
-        entries = sorted(entries, key=lambda e: e.date)
+        lo, hi = dataset.date_index_range(start_date, end_date)
         
-        return jsonify({
-            "success": True,
-            "data": [entry.to_dict() for entry in entries],
-            "count": len(entries),
-            "source": {
-                "sheet_id": dataset.source_sheet_id,
-                "sheet_name": dataset.source_sheet_name,
-                "last_updated": dataset.last_updated.isoformat() if dataset.last_updated else None
-            }
-        })
+        # Splice the pre-serialized entries in rather than re-encoding them
+        body = _stream_json_array(
+            '{"success":true,"data":[',
+            dataset.entries_json[lo:hi],
+            f'],"count":{hi - lo},"source":{source}}}\n'
+        )
+        return _with_validators(Response(body, mimetype="application/json"), dataset)
     
     except GoogleSheetsError as e:
         logger.error(f"Google Sheets error: {e}")
@@ -118,6 +413,57 @@ def get_net_worth():
         }), 500
 
 
+def _build_summary_json(dataset):
+    """
+    Serialize the summary response for a non-empty dataset.
+    
+    Decimal fields are left to the JSON provider, which writes them as
+    strings; zero and missing values are reported as null.
+    """
+    sorted_entries = dataset.sorted_entries
+    latest = sorted_entries[-1]
+    
+    # Calculate summary stats
+    summary = {
+        "latest": {
+            "date": latest.date.isoformat(),
+            "net_worth": latest.net_worth or None,
+            "investible_assets": latest.investible_assets or None,
+            "semi_liquid_assets": latest.semi_liquid_assets or None,
+        },
+        "ytd": {
+            "change_dollars": latest.ytd_change_dollars or None,
+            "change_percent": latest.ytd_change_percent or None,
+        },
+        "withdrawals": {
+            "three_percent": latest.withdrawal_3_percent or None,
+            "four_percent": latest.withdrawal_4_percent or None,
+        },
+        "projections": {
+            "eight_percent_growth": latest.growth_8_percent or None,
+        },
+        "total_entries": len(dataset.entries),
+        "date_range": {
+            "earliest": sorted_entries[0].date.isoformat(),
+            "latest": sorted_entries[-1].date.isoformat(),
+        }
+    }
+    
+    # Get account breakdown from latest entry
+    account_balances = latest.get_account_balances()
+    summary["accounts"] = {k: str(v) for k, v in account_balances.items()}
+    
+    return app.json.dumps({
+        "success": True,
+        "summary": summary,
+        "source": {
+            "sheet_id": dataset.source_sheet_id,
+            "sheet_name": dataset.source_sheet_name,
+            "last_updated": dataset.last_updated.isoformat() if dataset.last_updated else None
+        }
+    })
+
+
 @app.route("/marketapi/v1/networth/summary", methods=["GET"])
 @auth.login_required
 def get_net_worth_summary():
@@ -127,64 +473,23 @@ def get_net_worth_summary():
     Returns:
         JSON with summary statistics
     """
-    from datetime import datetime, timedelta
-    try:
-        from services.google_sheets import load_net_worth_from_sheets, GoogleSheetsError
-    except ImportError as e:
+    if _google_sheets_import_error is not None:
         return jsonify({
             "error": "Google Sheets dependencies not installed",
-            "details": str(e)
+            "details": str(_google_sheets_import_error)
         }), 500
     
     try:
-        dataset = load_net_worth_from_sheets()
+        dataset = _load_dataset()
+        not_modified = _not_modified(dataset)
+        if not_modified is not None:
+            return not_modified
         
         if not dataset.entries:
             return jsonify({"success": False, "error": "No data found"}), 404
         
-        # Sort entries by date
-        sorted_entries = sorted(dataset.entries, key=lambda e: e.date)
-        latest = sorted_entries[-1]
-        
-        # Calculate summary stats
-        summary = {
-            "latest": {
-                "date": latest.date.isoformat(),
-                "net_worth": str(latest.net_worth) if latest.net_worth else None,
-                "investible_assets": str(latest.investible_assets) if latest.investible_assets else None,
-                "semi_liquid_assets": str(latest.semi_liquid_assets) if latest.semi_liquid_assets else None,
-            },
-            "ytd": {
-                "change_dollars": str(latest.ytd_change_dollars) if latest.ytd_change_dollars else None,
-                "change_percent": str(latest.ytd_change_percent) if latest.ytd_change_percent else None,
-            },
-            "withdrawals": {
-                "three_percent": str(latest.withdrawal_3_percent) if latest.withdrawal_3_percent else None,
-                "four_percent": str(latest.withdrawal_4_percent) if latest.withdrawal_4_percent else None,
-            },
-            "projections": {
-                "eight_percent_growth": str(latest.growth_8_percent) if latest.growth_8_percent else None,
-            },
-            "total_entries": len(dataset.entries),
-            "date_range": {
-                "earliest": sorted_entries[0].date.isoformat(),
-                "latest": sorted_entries[-1].date.isoformat(),
-            }
-        }
-        
-        # Get account breakdown from latest entry
-        account_balances = latest.get_account_balances()
-        summary["accounts"] = {k: str(v) for k, v in account_balances.items()}
-        
-        return jsonify({
-            "success": True,
-            "summary": summary,
-            "source": {
-                "sheet_id": dataset.source_sheet_id,
-                "sheet_name": dataset.source_sheet_name,
-                "last_updated": dataset.last_updated.isoformat() if dataset.last_updated else None
-            }
-        })
+        body = dataset.memoize(_build_summary_json)
+        return _with_validators(Response(body, mimetype="application/json"), dataset)
     
     except GoogleSheetsError as e:
         logger.error(f"Google Sheets error: {e}")
@@ -208,6 +513,49 @@ def health_check():
     return jsonify({"status": "healthy", "service": "MarketApp"})
 
 
+def _timeseries_payload(dataset, period, metrics_param, width=None):
+    """Build the timeseries chart payload for a non-empty dataset."""
+    start_date = _period_map(date.today()).get(period)
+    
+    # Filter entries (already sorted by date)
+    lo, _ = dataset.date_index_range(start_date)
+    
+    requested_metrics = [m.strip() for m in metrics_param.split(",")]
+    
+    # Build response data
+    labels = dataset.date_labels[lo:]
+    series = {
+        metric: dataset.float_column(metric)[lo:]
+        for metric in requested_metrics
+        if metric in _METRIC_STYLES
+    }
+    
+    # Only downsample when there are more points than M4 would keep
+    if width and width > 0 and len(labels) > 4 * width:
+        xs = [d.toordinal() for d in dataset.dates[lo:]]
+        keep = _m4_indices(xs, list(series.values()), width)
+        labels = [labels[i] for i in keep]
+        series = {metric: [data[i] for i in keep] for metric, data in series.items()}
+    
+    datasets = {}
+    for metric, data in series.items():
+        label, color, background = _METRIC_STYLES[metric]
+        datasets[metric] = {
+            "label": label,
+            "data": data,
+            "borderColor": color,
+            "backgroundColor": background,
+        }
+    
+    return {
+        "success": True,
+        "labels": labels,
+        "datasets": datasets,
+        "period": period,
+        "dataPoints": len(labels)
+    }
+
+
 @app.route("/marketapi/v1/networth/chart/timeseries", methods=["GET"])
 @auth.login_required
 def get_net_worth_timeseries():
@@ -218,87 +566,69 @@ def get_net_worth_timeseries():
         period: '1m', '3m', '6m', '1y', 'ytd', 'all' (default: 'all')
         metrics: comma-separated list of metrics to include
                  (net_worth, investible_assets, semi_liquid_assets)
+        w: optional chart width in device pixels; longer series are reduced
+           to the points M4 keeps for that width
     
     Returns:
         JSON with labels (dates) and datasets for Chart.js
     """
-    from datetime import datetime, timedelta
-    from decimal import Decimal
-    
-    try:
-        from services.google_sheets import load_net_worth_from_sheets, GoogleSheetsError
-    except ImportError as e:
+    if _google_sheets_import_error is not None:
         return jsonify({"error": "Google Sheets dependencies not installed"}), 500
     
     try:
-        dataset = load_net_worth_from_sheets()
+        dataset = _load_dataset()
+        not_modified = _not_modified(dataset)
+        if not_modified is not None:
+            return not_modified
         
         if not dataset.entries:
             return jsonify({"success": False, "error": "No data found"}), 404
         
-        # Parse period parameter
-        period = request.args.get("period", "all").lower()
-        today = datetime.now().date()
-        
-        period_map = {
-            "1m": today - timedelta(days=30),
-            "3m": today - timedelta(days=90),
-            "6m": today - timedelta(days=180),
-            "1y": today - timedelta(days=365),
-            "ytd": today.replace(month=1, day=1),
-            "all": None
-        }
-        
-        start_date = period_map.get(period)
-        
-        # Filter and sort entries
-        entries = sorted(dataset.entries, key=lambda e: e.date)
-        if start_date:
-            entries = [e for e in entries if e.date >= start_date]
-        
-        # Parse metrics parameter
-        metrics_param = request.args.get("metrics", "net_worth")
-        requested_metrics = [m.strip() for m in metrics_param.split(",")]
-        
-        # Build response data
-        labels = [entry.date.isoformat() for entry in entries]
-        
-        def to_float(val):
-            if val is None:
-                return None
-            return float(val) if isinstance(val, Decimal) else val
-        
-        datasets = {}
-        metric_configs = {
-            "net_worth": {"label": "Net Worth", "color": "#667eea"},
-            "investible_assets": {"label": "Investible Assets", "color": "#28a745"},
-            "semi_liquid_assets": {"label": "Semi-Liquid Assets", "color": "#17a2b8"},
-            "daily_net_worth_change": {"label": "Daily Change", "color": "#ffc107"},
-        }
-        
-        for metric in requested_metrics:
-            if metric in metric_configs:
-                config = metric_configs[metric]
-                datasets[metric] = {
-                    "label": config["label"],
-                    "data": [to_float(getattr(entry, metric, None)) for entry in entries],
-                    "borderColor": config["color"],
-                    "backgroundColor": config["color"] + "20",
-                }
-        
-        return jsonify({
-            "success": True,
-            "labels": labels,
-            "datasets": datasets,
-            "period": period,
-            "dataPoints": len(entries)
-        })
+        payload = _timeseries_payload(
+            dataset,
+            request.args.get("period", "all").lower(),
+            request.args.get("metrics", "net_worth"),
+            request.args.get("w", type=int),
+        )
+        return _with_validators(jsonify(payload), dataset)
     
     except Exception as e:
         logger.exception("Error in get_net_worth_timeseries")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _build_allocation_json(dataset):
+    """Serialize the latest entry's account allocation of a non-empty dataset."""
+    latest = dataset.get_latest_entry()
+    balances = latest.get_account_balances()
+    
+    # Filter out zero/negative values and sort by value
+    balances_f = {k: float(v) for k, v in balances.items() if v}
+    positive_balances = {k: v for k, v in balances_f.items() if v > 0}
+    sorted_accounts = sorted(positive_balances.items(), key=itemgetter(1), reverse=True)
+    
+    total = sum(positive_balances.values())
+    
+    allocation = []
+    for i, (account, value) in enumerate(sorted_accounts):
+        allocation.append({
+            "account": account,
+            "value": value,
+            "percentage": round((value / total) * 100, 2) if total > 0 else 0,
+            "color": _ALLOCATION_PALETTE[i % len(_ALLOCATION_PALETTE)]
+        })
+    
+    return app.json.dumps({
+        "success": True,
+        "date": latest.date.isoformat(),
+        "total": total,
+        "allocation": allocation,
+        "labels": [a["account"] for a in allocation],
+        "data": [a["value"] for a in allocation],
+        "colors": [a["color"] for a in allocation]
+    })
+
+
 @app.route("/marketapi/v1/networth/chart/allocation", methods=["GET"])
 @auth.login_required
 def get_account_allocation():
@@ -308,56 +638,55 @@ def get_account_allocation():
     Returns:
         JSON with account names, values, and percentages
     """
-    try:
-        from services.google_sheets import load_net_worth_from_sheets, GoogleSheetsError
-    except ImportError as e:
+    if _google_sheets_import_error is not None:
         return jsonify({"error": "Google Sheets dependencies not installed"}), 500
     
     try:
-        dataset = load_net_worth_from_sheets()
+        dataset = _load_dataset()
+        not_modified = _not_modified(dataset)
+        if not_modified is not None:
+            return not_modified
         
         if not dataset.entries:
             return jsonify({"success": False, "error": "No data found"}), 404
         
-        latest = dataset.get_latest_entry()
-        balances = latest.get_account_balances()
-        
-        # Filter out zero/negative values and sort by value
-        positive_balances = {k: float(v) for k, v in balances.items() if v and float(v) > 0}
-        sorted_accounts = sorted(positive_balances.items(), key=lambda x: x[1], reverse=True)
-        
-        total = sum(positive_balances.values())
-        
-        # Color palette for accounts
-        colors = [
-            "#667eea", "#764ba2", "#28a745", "#17a2b8", "#ffc107",
-            "#dc3545", "#6f42c1", "#20c997", "#fd7e14", "#6c757d", "#e83e8c"
-        ]
-        
-        allocation = []
-        for i, (account, value) in enumerate(sorted_accounts):
-            allocation.append({
-                "account": account,
-                "value": value,
-                "percentage": round((value / total) * 100, 2) if total > 0 else 0,
-                "color": colors[i % len(colors)]
-            })
-        
-        return jsonify({
-            "success": True,
-            "date": latest.date.isoformat(),
-            "total": total,
-            "allocation": allocation,
-            "labels": [a["account"] for a in allocation],
-            "data": [a["value"] for a in allocation],
-            "colors": [a["color"] for a in allocation]
-        })
+        # The whole body only depends on the dataset; serialize it once
+        body = dataset.memoize(_build_allocation_json)
+        return _with_validators(Response(body, mimetype="application/json"), dataset)
     
     except Exception as e:
         logger.exception("Error in get_account_allocation")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _trends_payload(dataset, period):
+    """Build the per-account trends payload for a non-empty dataset."""
+    start_date = _period_map(date.today()).get(period)
+    
+    lo, _ = dataset.date_index_range(start_date)
+    labels = dataset.date_labels[lo:]
+    
+    datasets = []
+    for attr, label, color, background in _ACCOUNT_TREND_STYLES:
+        data = dataset.float_column(attr, missing=0)[lo:]
+        # Only include if there's actual data
+        if max(data, default=0) > 0:
+            datasets.append({
+                "label": label,
+                "data": data,
+                "backgroundColor": background,
+                "borderColor": color,
+                "fill": True
+            })
+    
+    return {
+        "success": True,
+        "labels": labels,
+        "datasets": datasets,
+        "period": period
+    }
+
+
 @app.route("/marketapi/v1/networth/chart/trends", methods=["GET"])
 @auth.login_required
 def get_account_trends():
@@ -370,84 +699,99 @@ def get_account_trends():
     Returns:
         JSON with time series data per account
     """
-    from datetime import datetime, timedelta
-    
-    try:
-        from services.google_sheets import load_net_worth_from_sheets, GoogleSheetsError
-    except ImportError as e:
+    if _google_sheets_import_error is not None:
         return jsonify({"error": "Google Sheets dependencies not installed"}), 500
     
     try:
-        dataset = load_net_worth_from_sheets()
+        dataset = _load_dataset()
+        not_modified = _not_modified(dataset)
+        if not_modified is not None:
+            return not_modified
         
         if not dataset.entries:
             return jsonify({"success": False, "error": "No data found"}), 404
         
-        # Parse period
-        period = request.args.get("period", "6m").lower()
-        today = datetime.now().date()
-        
-        period_map = {
-            "1m": today - timedelta(days=30),
-            "3m": today - timedelta(days=90),
-            "6m": today - timedelta(days=180),
-            "1y": today - timedelta(days=365),
-            "ytd": today.replace(month=1, day=1),
-            "all": None
-        }
-        
-        start_date = period_map.get(period)
-        
-        entries = sorted(dataset.entries, key=lambda e: e.date)
-        if start_date:
-            entries = [e for e in entries if e.date >= start_date]
-        
-        labels = [entry.date.isoformat() for entry in entries]
-        
-        # Account configurations
-        account_configs = [
-            ("etrade", "E*TRADE", "#667eea"),
-            ("crypto", "Crypto", "#f7931a"),
-            ("fidelity", "Fidelity", "#4caf50"),
-            ("thinkorswim", "thinkorswim", "#00bcd4"),
-            ("tradestation", "TradeStation", "#9c27b0"),
-            ("capital_one", "Capital One", "#dc3545"),
-            ("nfts", "NFTs", "#e91e63"),
-            ("car", "Car", "#607d8b"),
-            ("misc", "Misc", "#795548"),
-            ("inheritance", "Inheritance", "#009688"),
-        ]
-        
-        def to_float(val):
-            if val is None:
-                return 0
-            return float(val)
-        
-        datasets = []
-        for attr, label, color in account_configs:
-            data = [to_float(getattr(entry, attr, None)) for entry in entries]
-            # Only include if there's actual data
-            if any(d > 0 for d in data):
-                datasets.append({
-                    "label": label,
-                    "data": data,
-                    "backgroundColor": color + "80",
-                    "borderColor": color,
-                    "fill": True
-                })
-        
-        return jsonify({
-            "success": True,
-            "labels": labels,
-            "datasets": datasets,
-            "period": period
-        })
+        payload = _trends_payload(dataset, request.args.get("period", "6m").lower())
+        return _with_validators(jsonify(payload), dataset)
     
     except Exception as e:
         logger.exception("Error in get_account_trends")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _build_retirement_metrics(dataset):
+    """Compute the retirement payload from the latest entry of a non-empty dataset."""
+    latest = dataset.get_latest_entry()
+    
+    def to_float(val):
+        if val is None:
+            return None
+        return float(val)
+    
+    net_worth = to_float(latest.net_worth) or 0
+    living_expenses = to_float(latest.living_expenses) or 0
+    retirement_spending = to_float(latest.retirement_spending) or living_expenses
+    
+    # Calculate FIRE metrics
+    fire_number_25x = retirement_spending * 25 if retirement_spending else None
+    fire_number_33x = retirement_spending * 33 if retirement_spending else None
+    fire_progress_25x = (net_worth / fire_number_25x * 100) if fire_number_25x else None
+    fire_progress_33x = (net_worth / fire_number_33x * 100) if fire_number_33x else None
+    
+    # Years of expenses covered
+    years_covered = net_worth / retirement_spending if retirement_spending > 0 else None
+    
+    # Withdrawal scenarios
+    withdrawal_scenarios = {
+        "conservative_3pct": {
+            "rate": 3,
+            "annual": to_float(latest.withdrawal_3_percent),
+            "monthly": to_float(latest.withdrawal_3_percent) / 12 if latest.withdrawal_3_percent else None,
+        },
+        "balanced_3_5pct": {
+            "rate": 3.5,
+            "annual": net_worth * 0.035,
+            "monthly": net_worth * 0.035 / 12,
+        },
+        "standard_4pct": {
+            "rate": 4,
+            "annual": to_float(latest.withdrawal_4_percent),
+            "monthly": to_float(latest.withdrawal_4_percent) / 12 if latest.withdrawal_4_percent else None,
+        }
+    }
+    
+    # Growth projections (compound growth)
+    projections = []
+    growth_rate = 0.08
+    current = net_worth
+    for year in range(1, 11):
+        current = current * (1 + growth_rate)
+        projections.append({
+            "year": year,
+            "projected_value": round(current, 2),
+            "withdrawal_4pct": round(current * 0.04, 2)
+        })
+    
+    return {
+        "success": True,
+        "date": latest.date.isoformat(),
+        "current": {
+            "net_worth": net_worth,
+            "living_expenses": living_expenses,
+            "retirement_spending": retirement_spending,
+        },
+        "fire": {
+            "number_25x": fire_number_25x,
+            "number_33x": fire_number_33x,
+            "progress_25x_percent": round(fire_progress_25x, 2) if fire_progress_25x else None,
+            "progress_33x_percent": round(fire_progress_33x, 2) if fire_progress_33x else None,
+            "years_of_expenses": round(years_covered, 1) if years_covered else None,
+        },
+        "withdrawals": withdrawal_scenarios,
+        "projections_8pct": projections
+    }
+
+
 @app.route("/marketapi/v1/networth/retirement", methods=["GET"])
 @auth.login_required
 def get_retirement_metrics():
@@ -457,91 +801,90 @@ def get_retirement_metrics():
     Returns:
         JSON with FIRE metrics, withdrawal scenarios, and projections
     """
-    from decimal import Decimal
-    
-    try:
-        from services.google_sheets import load_net_worth_from_sheets, GoogleSheetsError
-    except ImportError as e:
+    if _google_sheets_import_error is not None:
         return jsonify({"error": "Google Sheets dependencies not installed"}), 500
     
     try:
-        dataset = load_net_worth_from_sheets()
+        dataset = _load_dataset()
+        not_modified = _not_modified(dataset)
+        if not_modified is not None:
+            return not_modified
         
         if not dataset.entries:
             return jsonify({"success": False, "error": "No data found"}), 404
         
-        latest = dataset.get_latest_entry()
-        
-        def to_float(val):
-            if val is None:
-                return None
-            return float(val)
-        
-        net_worth = to_float(latest.net_worth) or 0
-        living_expenses = to_float(latest.living_expenses) or 0
-        retirement_spending = to_float(latest.retirement_spending) or living_expenses
-        
-        # Calculate FIRE metrics
-        fire_number_25x = retirement_spending * 25 if retirement_spending else None
-        fire_number_33x = retirement_spending * 33 if retirement_spending else None
-        fire_progress_25x = (net_worth / fire_number_25x * 100) if fire_number_25x else None
-        fire_progress_33x = (net_worth / fire_number_33x * 100) if fire_number_33x else None
-        
-        # Years of expenses covered
-        years_covered = net_worth / retirement_spending if retirement_spending > 0 else None
-        
-        # Withdrawal scenarios
-        withdrawal_scenarios = {
-            "conservative_3pct": {
-                "rate": 3,
-                "annual": to_float(latest.withdrawal_3_percent),
-                "monthly": to_float(latest.withdrawal_3_percent) / 12 if latest.withdrawal_3_percent else None,
-            },
-            "balanced_3_5pct": {
-                "rate": 3.5,
-                "annual": net_worth * 0.035,
-                "monthly": net_worth * 0.035 / 12,
-            },
-            "standard_4pct": {
-                "rate": 4,
-                "annual": to_float(latest.withdrawal_4_percent),
-                "monthly": to_float(latest.withdrawal_4_percent) / 12 if latest.withdrawal_4_percent else None,
-            }
-        }
+        return _with_validators(jsonify(dataset.memoize(_build_retirement_metrics)), dataset)
+    
+    except Exception as e:
+        logger.exception("Error in get_retirement_metrics")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+# Rows shown in the table's "Recent" view
+_RECENT_ENTRIES = 20
+
+
+def _build_bootstrap_head(dataset):
+    """
+    Serialize the period-independent dashboard data for a non-empty dataset.
+    
+    Each member is the same document its own endpoint returns, spliced from
+    the bodies already memoized on the dataset. The object is left open so
+    the period-dependent members can be appended per request.
+    """
+    return (
+        '{"success":true'
+        f',"summary":{dataset.memoize(_build_summary_json)}'
+        f',"allocation":{dataset.memoize(_build_allocation_json)}'
+        f',"retirement":{app.json.dumps(dataset.memoize(_build_retirement_metrics))}'
+        f',"recent":[{",".join(dataset.entries_json[-_RECENT_ENTRIES:])}]'
+    )
+
+
+@app.route("/marketapi/v1/networth/bootstrap", methods=["GET"])
+@auth.login_required
+def get_dashboard_bootstrap():
+    """
+    Get everything the dashboard shows on first load in one request.
+    
+    Query Parameters:
+        period: net worth chart period (default: 'all'; the dashboard
+                narrows it client-side)
+        metrics: net worth chart metrics (default: 'net_worth,investible_assets')
+        trends: account trends period (default: '6m')
+    
+    Returns:
+        JSON with the summary, allocation, retirement, timeseries and trends
+        responses, plus the most recent entries for the table
+    """
+    if _google_sheets_import_error is not None:
+        return jsonify({"error": "Google Sheets dependencies not installed"}), 500
+    
+    try:
+        dataset = _load_dataset()
+        not_modified = _not_modified(dataset)
+        if not_modified is not None:
+            return not_modified
         
-        # Growth projections (compound growth)
-        projections = []
-        growth_rate = 0.08
-        current = net_worth
-        for year in range(1, 11):
-            current = current * (1 + growth_rate)
-            projections.append({
-                "year": year,
-                "projected_value": round(current, 2),
-                "withdrawal_4pct": round(current * 0.04, 2)
-            })
+        if not dataset.entries:
+            return jsonify({"success": False, "error": "No data found"}), 404
         
-        return jsonify({
-            "success": True,
-            "date": latest.date.isoformat(),
-            "current": {
-                "net_worth": net_worth,
-                "living_expenses": living_expenses,
-                "retirement_spending": retirement_spending,
-            },
-            "fire": {
-                "number_25x": fire_number_25x,
-                "number_33x": fire_number_33x,
-                "progress_25x_percent": round(fire_progress_25x, 2) if fire_progress_25x else None,
-                "progress_33x_percent": round(fire_progress_33x, 2) if fire_progress_33x else None,
-                "years_of_expenses": round(years_covered, 1) if years_covered else None,
-            },
-            "withdrawals": withdrawal_scenarios,
-            "projections_8pct": projections
-        })
+        timeseries = _timeseries_payload(
+            dataset,
+            request.args.get("period", "all").lower(),
+            request.args.get("metrics", "net_worth,investible_assets"),
+        )
+        trends = _trends_payload(dataset, request.args.get("trends", "6m").lower())
+        body = (
+            f'{dataset.memoize(_build_bootstrap_head)}'
+            f',"timeseries":{app.json.dumps(timeseries)}'
+            f',"trends":{app.json.dumps(trends)}'
+            '}'
+        )
+        return _with_validators(Response(body, mimetype="application/json"), dataset)
     
     except Exception as e:
-        logger.exception("Error in get_retirement_metrics")
+        logger.exception("Error in get_dashboard_bootstrap")
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -549,20 +892,20 @@ def get_retirement_metrics():
 # Dashboard UI
 # ============================================================================
 
-@app.route("/")
-@app.route("/marketapi")
-@app.route("/dashboard")
-@auth.login_required
-def dashboard():
-    return """
+# Kept as a module constant so the view never rebuilds it; the literal's
+# leftover indentation is stripped once here (~6KB less to send).
+_DASHBOARD_HTML = textwrap.dedent("""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Net Worth Dashboard</title>
-        <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-        <script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns"></script>
+        <link rel="preconnect" href="https://cdn.jsdelivr.net">
+        <script defer src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+        <script defer src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns"></script>
+        <script defer src="__DASHBOARD_JS_URL__"></script>
+        <link rel="preload" href="/marketapi/v1/networth/bootstrap" as="fetch" crossorigin="use-credentials">
         <style>
             :root {
                 --primary: #667eea;
@@ -576,6 +919,7 @@ def dashboard():
                 --gray: #6c757d;
                 --card-shadow: 0 4px 6px rgba(0, 0, 0, 0.07), 0 1px 3px rgba(0, 0, 0, 0.1);
                 --card-shadow-hover: 0 10px 25px rgba(0, 0, 0, 0.15);
+                --grad-primary: linear-gradient(135deg, var(--primary), var(--primary-dark));
             }
             
             * {
@@ -586,7 +930,7 @@ def dashboard():
             
             body {
                 font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, Roboto, Oxygen, Ubuntu, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                background: var(--grad-primary);
                 min-height: 100vh;
                 color: var(--dark);
             }
@@ -598,7 +942,7 @@ def dashboard():
             
             /* Header */
             .header {
-                background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
+                background: var(--grad-primary);
                 color: white;
                 padding: 20px 30px;
                 display: flex;
@@ -707,7 +1051,17 @@ def dashboard():
                 font-size: 1.5em;
             }
             
-            .card-icon.primary { background: linear-gradient(135deg, var(--primary), var(--primary-dark)); }
+            .card-icon svg {
+                width: 24px;
+                height: 24px;
+                fill: none;
+                stroke: white;
+                stroke-width: 2;
+                stroke-linecap: round;
+                stroke-linejoin: round;
+            }
+            
+            .card-icon.primary { background: var(--grad-primary); }
             .card-icon.success { background: linear-gradient(135deg, #28a745, #20c997); }
             .card-icon.warning { background: linear-gradient(135deg, #ffc107, #fd7e14); }
             .card-icon.info { background: linear-gradient(135deg, #17a2b8, #0dcaf0); }
@@ -998,7 +1352,7 @@ def dashboard():
             
             .custom-withdrawal-btn {
                 padding: 10px 16px;
-                background: linear-gradient(135deg, var(--primary), var(--primary-dark));
+                background: var(--grad-primary);
                 color: white;
                 border: none;
                 border-radius: 8px;
@@ -1073,6 +1427,21 @@ def dashboard():
                 overflow-x: auto;
             }
             
+            .table-container.windowed {
+                max-height: 600px;
+                overflow-y: auto;
+            }
+            
+            .table-container.windowed th {
+                position: sticky;
+                top: 0;
+            }
+            
+            .row-spacer td {
+                padding: 0;
+                border: 0;
+            }
+            
             table {
                 width: 100%;
                 border-collapse: collapse;
@@ -1114,19 +1483,6 @@ def dashboard():
                 color: var(--gray);
             }
             
-            .spinner {
-                width: 40px;
-                height: 40px;
-                border: 3px solid #f0f0f0;
-                border-top-color: var(--primary);
-                border-radius: 50%;
-                animation: spin 1s linear infinite;
-            }
-            
-            @keyframes spin {
-                to { transform: rotate(360deg); }
-            }
-            
             /* Tab Navigation */
             .tabs {
                 display: flex;
@@ -1161,12 +1517,15 @@ def dashboard():
             
             /* Utilities */
             .text-muted { color: var(--gray); }
-            .text-success { color: var(--success); }
-            .text-danger { color: var(--danger); }
-            .mb-0 { margin-bottom: 0; }
         </style>
     </head>
     <body>
+        <svg style="display:none" aria-hidden="true">
+            <symbol id="i-gem" viewBox="0 0 24 24"><path d="M6 3h12l4 6-10 12L2 9zM2 9h20M12 21 8 9l4-6 4 6-4 12"/></symbol>
+            <symbol id="i-trend" viewBox="0 0 24 24"><path d="m23 6-9.5 9.5-5-5L1 18M17 6h6v6"/></symbol>
+            <symbol id="i-bars" viewBox="0 0 24 24"><path d="M12 20V10M18 20V4M6 20v-4"/></symbol>
+            <symbol id="i-bank" viewBox="0 0 24 24"><path d="M3 21h18M3 10h18M5 6l7-3 7 3M4 10v11m16-11v11M8 14v3m4-3v3m4-3v3"/></symbol>
+        </svg>
         <div class="app-container">
             <!-- Header -->
             <header class="header">
@@ -1186,7 +1545,7 @@ def dashboard():
                     <div class="card">
                         <div class="card-header">
                             <span class="card-title">Total Net Worth</span>
-                            <div class="card-icon primary">💎</div>
+                            <div class="card-icon primary"><svg><use href="#i-gem"/></svg></div>
                         </div>
                         <div class="card-value" id="netWorthValue">--</div>
                         <span class="card-change positive" id="netWorthChange">--</span>
@@ -1195,7 +1554,7 @@ def dashboard():
                     <div class="card">
                         <div class="card-header">
                             <span class="card-title">Investible Assets</span>
-                            <div class="card-icon success">📈</div>
+                            <div class="card-icon success"><svg><use href="#i-trend"/></svg></div>
                         </div>
                         <div class="card-value" id="investibleValue">--</div>
                         <span class="card-change positive" id="investiblePct">--</span>
@@ -1204,7 +1563,7 @@ def dashboard():
                     <div class="card">
                         <div class="card-header">
                             <span class="card-title">YTD Change</span>
-                            <div class="card-icon warning">📊</div>
+                            <div class="card-icon warning"><svg><use href="#i-bars"/></svg></div>
                         </div>
                         <div class="card-value" id="ytdValue">--</div>
                         <span class="card-change positive" id="ytdPct">--</span>
@@ -1213,7 +1572,7 @@ def dashboard():
                     <div class="card">
                         <div class="card-header">
                             <span class="card-title">4% Safe Withdrawal</span>
-                            <div class="card-icon info">🏦</div>
+                            <div class="card-icon info"><svg><use href="#i-bank"/></svg></div>
                         </div>
                         <div class="card-value" id="withdrawalValue">--</div>
                         <span class="text-muted" id="withdrawalMonthly">-- /month</span>
@@ -1367,7 +1726,7 @@ def dashboard():
                             <button class="tab" data-view="all">All Data</button>
                         </div>
                     </div>
-                    <div class="table-container">
+                    <div class="table-container" id="tableContainer">
                         <table>
                             <thead>
                                 <tr>
@@ -1385,23 +1744,39 @@ def dashboard():
                                 <tr><td colspan="8" class="loading">Loading data...</td></tr>
                             </tbody>
                         </table>
+                        <template id="rowTpl">
+                            <tr><td></td><td><strong></strong></td><td></td><td></td><td></td><td></td><td></td><td class="text-muted"></td></tr>
+                        </template>
                     </div>
                 </div>
             </main>
         </div>
-        
-        <script>
+    </body>
+    </html>
+    """).lstrip()
+
+# The dashboard's client script is served from its own content-hashed URL
+# so browsers cache it across page loads and only refetch it after a change.
+_DASHBOARD_JS = textwrap.dedent("""
             // Format currency
+            // Formatters are built once; constructing Intl objects per call is slow
+            const currencyFormat = new Intl.NumberFormat('en-US', {
+                style: 'currency',
+                currency: 'USD',
+                minimumFractionDigits: 0,
+                maximumFractionDigits: 0
+            });
+            const dateFormat = new Intl.DateTimeFormat('en-US', {
+                year: 'numeric',
+                month: 'short',
+                day: 'numeric'
+            });
+            
             const formatCurrency = (value) => {
                 if (value === null || value === undefined) return '--';
                 const num = parseFloat(value);
                 if (isNaN(num)) return '--';
-                return new Intl.NumberFormat('en-US', {
-                    style: 'currency',
-                    currency: 'USD',
-                    minimumFractionDigits: 0,
-                    maximumFractionDigits: 0
-                }).format(num);
+                return currencyFormat.format(num);
             };
             
             const formatPercent = (value) => {
@@ -1413,70 +1788,122 @@ def dashboard():
             };
             
             const formatDate = (dateStr) => {
-                return new Date(dateStr).toLocaleDateString('en-US', {
-                    year: 'numeric',
-                    month: 'short',
-                    day: 'numeric'
-                });
+                return dateFormat.format(new Date(dateStr));
             };
             
             // Chart instances
             let netWorthChart, allocationChart, trendsChart, projectionChart;
             let currentPeriod = '1y';
             let trendsPeriod = '6m';
+            let nwSeries = null;
+            let trendsRequest = null;
+            let tableTabs = [];
+            const PERIOD_DAYS = { '1m': 30, '3m': 90, '6m': 180, '1y': 365 };
+            
+            // "All Data" table window: only rows near the viewport are in the DOM
+            const TABLE_OVERSCAN = 20;
+            let tableEntries = [];
+            let tableWindowed = false;
+            let tableRowHeight = 49;
+            let tableFramePending = false;
+            let tableRows = [];
+            let tableTopSpacer = null, tableBottomSpacer = null;
+            let tableWindow = null;
+            
+            // Element references by id, looked up once the document is parsed
+            const els = {};
             
             // Initialize
             document.addEventListener('DOMContentLoaded', () => {
+                document.querySelectorAll('[id]').forEach(el => { els[el.id] = el; });
                 initCharts();
                 loadAllData();
                 setupEventListeners();
             });
             
+            // Trailing-edge debounce that runs in the next animation frame, so a
+            // burst of period clicks only redraws (and fetches) for the last one
+            const debounce = (fn, ms) => {
+                let timer;
+                return (...args) => {
+                    clearTimeout(timer);
+                    timer = setTimeout(() => requestAnimationFrame(() => fn(...args)), ms);
+                };
+            };
+            const showNetWorthPeriodSoon = debounce(() => showNetWorthPeriod(), 120);
+            const loadTrendsChartSoon = debounce(() => loadTrendsChart(), 120);
+            
             function setupEventListeners() {
+                // Look the button groups up once; the handlers reuse these arrays
+                const mainBtns = [...document.querySelectorAll('.period-selector:not(#trendsPeriodSelector) .period-btn')];
+                const trendsBtns = [...document.querySelectorAll('#trendsPeriodSelector .period-btn')];
+                tableTabs = [...document.querySelectorAll('.tab')];
+                
                 // Period selectors for main chart
-                document.querySelectorAll('.period-selector:not(#trendsPeriodSelector) .period-btn').forEach(btn => {
+                mainBtns.forEach(btn => {
                     btn.addEventListener('click', (e) => {
-                        document.querySelectorAll('.period-selector:not(#trendsPeriodSelector) .period-btn').forEach(b => b.classList.remove('active'));
+                        mainBtns.forEach(b => b.classList.remove('active'));
                         e.currentTarget.classList.add('active');
                         currentPeriod = e.currentTarget.dataset.period;
-                        loadNetWorthChart();
+                        showNetWorthPeriodSoon();
                     });
                 });
                 
                 // Period selectors for trends chart
-                document.querySelectorAll('#trendsPeriodSelector .period-btn').forEach(btn => {
+                trendsBtns.forEach(btn => {
                     btn.addEventListener('click', (e) => {
-                        document.querySelectorAll('#trendsPeriodSelector .period-btn').forEach(b => b.classList.remove('active'));
+                        trendsBtns.forEach(b => b.classList.remove('active'));
                         e.currentTarget.classList.add('active');
                         trendsPeriod = e.currentTarget.dataset.period;
-                        loadTrendsChart();
+                        loadTrendsChartSoon();
                     });
                 });
                 
                 // Table view tabs
-                document.querySelectorAll('.tab').forEach(tab => {
+                tableTabs.forEach(tab => {
                     tab.addEventListener('click', (e) => {
-                        document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+                        tableTabs.forEach(t => t.classList.remove('active'));
                         e.currentTarget.classList.add('active');
                         loadTableData(e.currentTarget.dataset.view);
                     });
                 });
+                
+                els.tableContainer.addEventListener('scroll', () => {
+                    if (!tableWindowed || tableFramePending) return;
+                    tableFramePending = true;
+                    requestAnimationFrame(() => {
+                        tableFramePending = false;
+                        renderTableRows();
+                    });
+                }, { passive: true });
             }
             
             function initCharts() {
+                // Redraw immediately on every update; tweening each point of
+                // a long history is most of what an update would cost
+                Chart.defaults.animation = false;
+                
                 // Net Worth Line Chart
-                const nwCtx = document.getElementById('netWorthChart').getContext('2d');
+                const nwCtx = els.netWorthChart.getContext('2d');
+                // Points are pre-parsed {x: epoch ms, y} in date order, which
+                // lets Chart.js skip parsing and decimate long histories
                 netWorthChart = new Chart(nwCtx, {
                     type: 'line',
-                    data: { labels: [], datasets: [] },
+                    data: { datasets: [] },
                     options: {
                         responsive: true,
                         maintainAspectRatio: false,
+                        parsing: false,
+                        normalized: true,
+                        spanGaps: true,
                         plugins: {
-                            legend: { display: false }
+                            legend: { display: false },
+                            decimation: { enabled: true, algorithm: 'lttb' }
                         },
                         scales: {
                             x: {
+                                type: 'time',
+                                time: { tooltipFormat: 'MMM d, yyyy' },
                                 grid: { display: false }
                             },
                             y: {
@@ -1493,7 +1920,7 @@ def dashboard():
                 });
                 
                 // Allocation Doughnut Chart
-                const allocCtx = document.getElementById('allocationChart').getContext('2d');
+                const allocCtx = els.allocationChart.getContext('2d');
                 allocationChart = new Chart(allocCtx, {
                     type: 'doughnut',
                     data: { labels: [], datasets: [] },
@@ -1508,18 +1935,26 @@ def dashboard():
                 });
                 
                 // Trends Stacked Area Chart
-                const trendsCtx = document.getElementById('trendsChart').getContext('2d');
+                const trendsCtx = els.trendsChart.getContext('2d');
+                // Same pre-parsed {x, y} points as the net worth chart
                 trendsChart = new Chart(trendsCtx, {
                     type: 'line',
-                    data: { labels: [], datasets: [] },
+                    data: { datasets: [] },
                     options: {
                         responsive: true,
                         maintainAspectRatio: false,
+                        parsing: false,
+                        normalized: true,
                         plugins: {
                             legend: { position: 'top' }
                         },
                         scales: {
-                            x: { grid: { display: false }, stacked: true },
+                            x: {
+                                type: 'time',
+                                time: { tooltipFormat: 'MMM d, yyyy' },
+                                grid: { display: false },
+                                stacked: true
+                            },
                             y: {
                                 stacked: true,
                                 ticks: {
@@ -1531,7 +1966,7 @@ def dashboard():
                 });
                 
                 // Projection Chart
-                const projCtx = document.getElementById('projectionChart').getContext('2d');
+                const projCtx = els.projectionChart.getContext('2d');
                 projectionChart = new Chart(projCtx, {
                     type: 'bar',
                     data: { labels: [], datasets: [] },
@@ -1552,67 +1987,83 @@ def dashboard():
                 });
             }
             
-            async function loadAllData() {
-                await Promise.all([
-                    loadSummary(),
-                    loadNetWorthChart(),
-                    loadAllocation(),
-                    loadTrendsChart(),
-                    loadRetirement(),
-                    loadTableData('recent')
-                ]);
+            async function loadAllData(fresh = false) {
+                await loadBootstrap(fresh);
             }
             
-            async function loadSummary() {
+            // Everything on the first screen arrives in one request; the
+            // trends default matches its initial period selection
+            async function loadBootstrap(fresh = false) {
                 try {
-                    const res = await fetch('/marketapi/v1/networth/summary', { credentials: 'include' });
+                    const url = '/marketapi/v1/networth/bootstrap' + (fresh ? '?refresh=true' : '');
+                    const res = await fetch(url, { credentials: 'include', cache: fresh ? 'no-cache' : 'default' });
                     const data = await res.json();
                     
+                    if (data.success) {
+                        renderSummary(data.summary);
+                        renderAllocation(data.allocation);
+                        renderRetirement(data.retirement);
+                        renderNetWorthChart(data.timeseries);
+                        renderTrends(data.trends);
+                        showTableEntries(data.recent, 'recent');
+                        tableTabs.forEach(t => t.classList.toggle('active', t.dataset.view === 'recent'));
+                    }
+                } catch (err) {
+                    console.error('Failed to load dashboard data:', err);
+                }
+            }
+            
+            function renderSummary(data) {
+                try {
                     if (data.success) {
                         const s = data.summary;
-                        document.getElementById('netWorthValue').textContent = formatCurrency(s.latest.net_worth);
-                        document.getElementById('investibleValue').textContent = formatCurrency(s.latest.investible_assets);
-                        document.getElementById('ytdValue').textContent = formatCurrency(s.ytd.change_dollars);
-                        document.getElementById('withdrawalValue').textContent = formatCurrency(s.withdrawals.four_percent);
+                        els.netWorthValue.textContent = formatCurrency(s.latest.net_worth);
+                        els.investibleValue.textContent = formatCurrency(s.latest.investible_assets);
+                        els.ytdValue.textContent = formatCurrency(s.ytd.change_dollars);
+                        els.withdrawalValue.textContent = formatCurrency(s.withdrawals.four_percent);
                         
                         // Set change indicators
                         const ytdPct = parseFloat(s.ytd.change_percent);
-                        const ytdEl = document.getElementById('ytdPct');
+                        const ytdEl = els.ytdPct;
                         ytdEl.textContent = formatPercent(ytdPct);
                         ytdEl.className = 'card-change ' + (ytdPct >= 0 ? 'positive' : 'negative');
                         
-                        const nwChangeEl = document.getElementById('netWorthChange');
+                        const nwChangeEl = els.netWorthChange;
                         nwChangeEl.textContent = formatPercent(ytdPct) + ' YTD';
                         nwChangeEl.className = 'card-change ' + (ytdPct >= 0 ? 'positive' : 'negative');
                         
                         // Monthly withdrawal
                         const monthly = parseFloat(s.withdrawals.four_percent) / 12;
-                        document.getElementById('withdrawalMonthly').textContent = formatCurrency(monthly) + ' /month';
+                        els.withdrawalMonthly.textContent = formatCurrency(monthly) + ' /month';
                         
                         // Investible percentage of net worth
                         const invPct = (parseFloat(s.latest.investible_assets) / parseFloat(s.latest.net_worth) * 100).toFixed(1);
-                        document.getElementById('investiblePct').textContent = invPct + '% of NW';
-                        document.getElementById('investiblePct').className = 'card-change positive';
+                        els.investiblePct.textContent = invPct + '% of NW';
+                        els.investiblePct.className = 'card-change positive';
                         
                         // Last updated
-                        document.getElementById('lastUpdated').textContent = 'Last entry: ' + formatDate(s.latest.date);
+                        els.lastUpdated.textContent = 'Last entry: ' + formatDate(s.latest.date);
                     }
                 } catch (err) {
                     console.error('Failed to load summary:', err);
                 }
             }
             
-            async function loadNetWorthChart() {
+            // The chart keeps the whole history and period buttons only change
+            // which tail of it is shown, so switching periods needs no request
+            function renderNetWorthChart(data) {
                 try {
-                    const res = await fetch(`/marketapi/v1/networth/chart/timeseries?period=${currentPeriod}&metrics=net_worth,investible_assets`, { credentials: 'include' });
-                    const data = await res.json();
-                    
                     if (data.success) {
-                        netWorthChart.data.labels = data.labels.map(d => formatDate(d));
+                        const xs = data.labels.map(d => Date.parse(d));
+                        const toPoints = (ys) => ys.map((y, i) => ({ x: xs[i], y }));
+                        nwSeries = [
+                            toPoints(data.datasets.net_worth.data),
+                            toPoints(data.datasets.investible_assets?.data || [])
+                        ];
                         netWorthChart.data.datasets = [
                             {
                                 label: 'Net Worth',
-                                data: data.datasets.net_worth.data,
+                                data: [],
                                 borderColor: '#667eea',
                                 backgroundColor: 'rgba(102, 126, 234, 0.1)',
                                 fill: true,
@@ -1620,25 +2071,46 @@ def dashboard():
                             },
                             {
                                 label: 'Investible',
-                                data: data.datasets.investible_assets?.data || [],
+                                data: [],
                                 borderColor: '#28a745',
                                 backgroundColor: 'transparent',
                                 borderDash: [5, 5],
                                 tension: 0.3
                             }
                         ];
-                        netWorthChart.update();
+                        showNetWorthPeriod();
                     }
                 } catch (err) {
                     console.error('Failed to load net worth chart:', err);
                 }
             }
             
-            async function loadAllocation() {
+            // Start of a period as epoch ms, matching the server's period codes
+            function periodStart(period) {
+                const today = new Date();
+                if (period === 'ytd') return Date.UTC(today.getFullYear(), 0, 1);
+                const days = PERIOD_DAYS[period];
+                if (days === undefined) return -Infinity;
+                return Date.UTC(today.getFullYear(), today.getMonth(), today.getDate()) - days * 86400000;
+            }
+            
+            function showNetWorthPeriod() {
+                if (!nwSeries) return;
+                const cutoff = periodStart(currentPeriod);
+                nwSeries.forEach((points, i) => {
+                    // Points are in date order; binary search for the first one in range
+                    let lo = 0, hi = points.length;
+                    while (lo < hi) {
+                        const mid = (lo + hi) >> 1;
+                        if (points[mid].x < cutoff) lo = mid + 1; else hi = mid;
+                    }
+                    netWorthChart.data.datasets[i].data = points.slice(lo);
+                });
+                netWorthChart.update('none');
+            }
+            
+            function renderAllocation(data) {
                 try {
-                    const res = await fetch('/marketapi/v1/networth/chart/allocation', { credentials: 'include' });
-                    const data = await res.json();
-                    
                     if (data.success) {
                         allocationChart.data.labels = data.labels;
                         allocationChart.data.datasets = [{
@@ -1649,7 +2121,7 @@ def dashboard():
                         allocationChart.update();
                         
                         // Build legend
-                        const legend = document.getElementById('allocationLegend');
+                        const legend = els.allocationLegend;
                         legend.innerHTML = data.allocation.slice(0, 6).map(a => `
                             <div class="legend-item">
                                 <span class="legend-label">
@@ -1669,13 +2141,27 @@ def dashboard():
             }
             
             async function loadTrendsChart() {
+                // A newer selection supersedes whatever is still in flight
+                if (trendsRequest) trendsRequest.abort();
+                const request = trendsRequest = new AbortController();
+                try {
+                    const res = await fetch(`/marketapi/v1/networth/chart/trends?period=${trendsPeriod}`, { credentials: 'include', signal: request.signal });
+                    renderTrends(await res.json());
+                } catch (err) {
+                    if (err.name !== 'AbortError') console.error('Failed to load trends:', err);
+                } finally {
+                    if (trendsRequest === request) trendsRequest = null;
+                }
+            }
+            
+            function renderTrends(data) {
                 try {
-                    const res = await fetch(`/marketapi/v1/networth/chart/trends?period=${trendsPeriod}`, { credentials: 'include' });
-                    const data = await res.json();
-                    
                     if (data.success) {
-                        trendsChart.data.labels = data.labels.map(d => formatDate(d));
-                        trendsChart.data.datasets = data.datasets;
+                        const xs = data.labels.map(d => Date.parse(d));
+                        trendsChart.data.datasets = data.datasets.map(ds => ({
+                            ...ds,
+                            data: ds.data.map((y, i) => ({ x: xs[i], y }))
+                        }));
                         trendsChart.update();
                     }
                 } catch (err) {
@@ -1683,29 +2169,26 @@ def dashboard():
                 }
             }
             
-            async function loadRetirement() {
+            function renderRetirement(data) {
                 try {
-                    const res = await fetch('/marketapi/v1/networth/retirement', { credentials: 'include' });
-                    const data = await res.json();
-                    
                     if (data.success) {
                         const f = data.fire;
                         const w = data.withdrawals;
                         
                         // FIRE progress
                         const progress = Math.min(f.progress_25x_percent || 0, 100);
-                        document.getElementById('fireProgressPct').textContent = progress.toFixed(1) + '%';
-                        document.getElementById('fireProgressBar').style.width = progress + '%';
-                        document.getElementById('fireNumber').textContent = formatCurrency(f.number_25x);
-                        document.getElementById('yearsExpenses').textContent = f.years_of_expenses ? f.years_of_expenses + ' yrs' : '--';
+                        els.fireProgressPct.textContent = progress.toFixed(1) + '%';
+                        els.fireProgressBar.style.width = progress + '%';
+                        els.fireNumber.textContent = formatCurrency(f.number_25x);
+                        els.yearsExpenses.textContent = f.years_of_expenses ? f.years_of_expenses + ' yrs' : '--';
                         
                         // Withdrawal amounts
-                        document.getElementById('w3pct').textContent = formatCurrency(w.conservative_3pct.annual);
-                        document.getElementById('w3pctMonthly').textContent = formatCurrency(w.conservative_3pct.monthly) + '/mo';
-                        document.getElementById('w35pct').textContent = formatCurrency(w.balanced_3_5pct.annual);
-                        document.getElementById('w35pctMonthly').textContent = formatCurrency(w.balanced_3_5pct.monthly) + '/mo';
-                        document.getElementById('w4pct').textContent = formatCurrency(w.standard_4pct.annual);
-                        document.getElementById('w4pctMonthly').textContent = formatCurrency(w.standard_4pct.monthly) + '/mo';
+                        els.w3pct.textContent = formatCurrency(w.conservative_3pct.annual);
+                        els.w3pctMonthly.textContent = formatCurrency(w.conservative_3pct.monthly) + '/mo';
+                        els.w35pct.textContent = formatCurrency(w.balanced_3_5pct.annual);
+                        els.w35pctMonthly.textContent = formatCurrency(w.balanced_3_5pct.monthly) + '/mo';
+                        els.w4pct.textContent = formatCurrency(w.standard_4pct.annual);
+                        els.w4pctMonthly.textContent = formatCurrency(w.standard_4pct.monthly) + '/mo';
                         
                         // Projection chart
                         const projections = data.projections_8pct;
@@ -1728,8 +2211,8 @@ def dashboard():
             
             // Custom withdrawal rate calculator
             function calculateCustomWithdrawal() {
-                const input = document.getElementById('customWithdrawalInput');
-                const resultDiv = document.getElementById('customWithdrawalResult');
+                const input = els.customWithdrawalInput;
+                const resultDiv = els.customWithdrawalResult;
                 const rate = parseFloat(input.value);
                 
                 if (isNaN(rate) || rate <= 0 || rate > 100) {
@@ -1746,15 +2229,15 @@ def dashboard():
                 const annual = netWorth * (rate / 100);
                 const monthly = annual / 12;
                 
-                document.getElementById('customResultRate').textContent = rate + '% Withdrawal';
-                document.getElementById('customAnnual').textContent = formatCurrency(annual);
-                document.getElementById('customMonthly').textContent = formatCurrency(monthly) + '/mo';
+                els.customResultRate.textContent = rate + '% Withdrawal';
+                els.customAnnual.textContent = formatCurrency(annual);
+                els.customMonthly.textContent = formatCurrency(monthly) + '/mo';
                 resultDiv.classList.add('show');
             }
             
             // Allow Enter key to trigger calculation
             document.addEventListener('DOMContentLoaded', function() {
-                const input = document.getElementById('customWithdrawalInput');
+                const input = els.customWithdrawalInput;
                 if (input) {
                     input.addEventListener('keypress', function(e) {
                         if (e.key === 'Enter') {
@@ -1773,41 +2256,228 @@ def dashboard():
                     if (data.success) {
                         let entries = data.data;
                         if (view === 'recent') entries = entries.slice(-20);
-                        entries = entries.reverse(); // Most recent first
-                        
-                        const tbody = document.getElementById('dataTableBody');
-                        tbody.innerHTML = entries.map(e => {
-                            const change = parseFloat(e.net_worth_change);
-                            const changeClass = change >= 0 ? 'amount-positive' : 'amount-negative';
-                            const changeSign = change >= 0 ? '+' : '';
-                            return `
-                                <tr>
-                                    <td>${formatDate(e.date)}</td>
-                                    <td><strong>${formatCurrency(e.net_worth)}</strong></td>
-                                    <td class="${changeClass}">${changeSign}${formatCurrency(change)}</td>
-                                    <td>${formatCurrency(e.etrade)}</td>
-                                    <td>${formatCurrency(e.crypto)}</td>
-                                    <td>${formatCurrency(e.fidelity)}</td>
-                                    <td>${formatCurrency(e.capital_one)}</td>
-                                    <td class="text-muted">${e.notes || '-'}</td>
-                                </tr>
-                            `;
-                        }).join('');
+                        showTableEntries(entries, view);
                     }
                 } catch (err) {
                     console.error('Failed to load table data:', err);
-                    document.getElementById('dataTableBody').innerHTML = '<tr><td colspan="8">Failed to load data</td></tr>';
+                    els.dataTableBody.innerHTML = '<tr><td colspan="8">Failed to load data</td></tr>';
+                }
+            }
+            
+            function showTableEntries(entries, view) {
+                tableEntries = entries.slice().reverse(); // Most recent first
+                tableWindowed = view !== 'recent';
+                const container = els.tableContainer;
+                container.classList.toggle('windowed', tableWindowed);
+                container.scrollTop = 0;
+                
+                // Start from an empty body: two spacers and no pooled rows
+                tableTopSpacer = tableSpacer();
+                tableBottomSpacer = tableSpacer();
+                tableRows = [];
+                tableWindow = null;
+                els.dataTableBody.replaceChildren(tableTopSpacer, tableBottomSpacer);
+                renderTableRows();
+            }
+            
+            function fillTableRow(row, e) {
+                const change = parseFloat(e.net_worth_change);
+                const cells = row.children;
+                cells[0].textContent = formatDate(e.date);
+                cells[1].firstChild.textContent = formatCurrency(e.net_worth);
+                cells[2].className = change >= 0 ? 'amount-positive' : 'amount-negative';
+                cells[2].textContent = (change >= 0 ? '+' : '') + formatCurrency(change);
+                cells[3].textContent = formatCurrency(e.etrade);
+                cells[4].textContent = formatCurrency(e.crypto);
+                cells[5].textContent = formatCurrency(e.fidelity);
+                cells[6].textContent = formatCurrency(e.capital_one);
+                cells[7].textContent = e.notes || '-';
+            }
+            
+            function tableSpacer() {
+                const row = document.createElement('tr');
+                row.className = 'row-spacer';
+                row.insertCell().colSpan = 8;
+                return row;
+            }
+            
+            function setSpacerHeight(spacer, height) {
+                spacer.hidden = height === 0;
+                spacer.firstChild.style.height = height + 'px';
+            }
+            
+            // Rows live in a pool between two spacer rows. In windowed mode only
+            // the rows around the scroll position exist; as the window moves the
+            // same row nodes are refilled and the spacers absorb the difference.
+            function renderTableRows() {
+                const tbody = els.dataTableBody;
+                const total = tableEntries.length;
+                let start = 0, end = total;
+                if (tableWindowed) {
+                    const container = els.tableContainer;
+                    const first = container.scrollTop / tableRowHeight | 0;
+                    const visible = Math.ceil(container.clientHeight / tableRowHeight);
+                    start = Math.max(0, first - TABLE_OVERSCAN);
+                    end = Math.min(total, first + visible + TABLE_OVERSCAN);
+                }
+                const key = start + ':' + end + ':' + tableRowHeight;
+                if (key === tableWindow) return;
+                tableWindow = key;
+                
+                // Grow or shrink the pool to the window size; new rows are
+                // cloned off-document and inserted in one go
+                const count = end - start;
+                if (tableRows.length < count) {
+                    const rowTpl = els.rowTpl.content.firstElementChild;
+                    const frag = document.createDocumentFragment();
+                    while (tableRows.length < count) {
+                        const row = rowTpl.cloneNode(true);
+                        tableRows.push(row);
+                        frag.appendChild(row);
+                    }
+                    tbody.insertBefore(frag, tableBottomSpacer);
+                } else {
+                    tableRows.splice(count).forEach(row => row.remove());
+                }
+                for (let i = 0; i < count; i++) {
+                    fillTableRow(tableRows[i], tableEntries[start + i]);
+                }
+                setSpacerHeight(tableTopSpacer, start * tableRowHeight);
+                setSpacerHeight(tableBottomSpacer, (total - end) * tableRowHeight);
+                
+                // Calibrate spacer sizing against a real rendered row
+                const sample = tableRows[0];
+                if (tableWindowed && sample && sample.offsetHeight && sample.offsetHeight !== tableRowHeight) {
+                    tableRowHeight = sample.offsetHeight;
+                    renderTableRows();
                 }
             }
             
+            // Clicks while a refresh is still loading join it instead of
+            // starting another wave of requests
+            let refreshPending = null;
             function refreshData() {
-                loadAllData();
+                if (!refreshPending) {
+                    refreshPending = loadAllData(true).finally(() => { refreshPending = null; });
+                }
+                return refreshPending;
             }
             
             function exportData() {
                 window.open('/marketapi/v1/networth', '_blank');
             }
-        </script>
-    </body>
-    </html>
+            
+            // Earlier versions shipped a service worker. The chart libraries
+            // and the content-hashed script are cached by plain HTTP caching
+            // now, so remove any worker and cache left behind.
+            window.addEventListener('load', () => {
+                if ('serviceWorker' in navigator) {
+                    navigator.serviceWorker.getRegistrations()
+                        .then(regs => regs.forEach(reg => reg.unregister()));
+                }
+                if ('caches' in window) {
+                    caches.keys().then(keys => keys
+                        .filter(key => key.startsWith('dashboard-'))
+                        .forEach(key => caches.delete(key)));
+                }
+            });
+""").lstrip()
+
+_STYLE_BLOCK = re.compile(r"(<style>)(.*?)(</style>)", re.DOTALL)
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+
+def _minify_style_blocks(html):
+    """Drop comments and redundant whitespace from the page's <style> blocks."""
+    def minify(match):
+        css = _CSS_COMMENT.sub("", match.group(2))
+        css = _CSS_WHITESPACE.sub(" ", css)
+        css = _CSS_PUNCTUATION.sub(r"\1", css).strip()
+        return match.group(1) + css + match.group(3)
+    return _STYLE_BLOCK.sub(minify, html)
+
+
+def _precompress(data):
+    """Compress data once, in order of preference: [(Content-Encoding, body)]."""
+    return [
+        ("br", brotli.compress(data, quality=11)),
+        ("gzip", gzip.compress(data, compresslevel=9, mtime=0)),
+    ]
+
+
+def _send_precompressed(body, encoded, etag, mimetype, cache_control):
+    """
+    Serve a static body, picking the best precompressed copy the client accepts.
+    
+    Each encoding gets its own ETag so a conditional request for any variant
+    can be answered with a 304.
     """
+    for encoding, encoded_body in encoded:
+        if request.accept_encodings[encoding]:
+            body, etag = encoded_body, f"{etag}-{encoding}"
+            break
+    else:
+        encoding = None
+    
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=mimetype)
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+    
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+# The dashboard page and script are static, so minify, encode and compress
+# them once at import instead of on every request.
+_DASHBOARD_JS_BYTES = _DASHBOARD_JS.encode("utf-8")
+_DASHBOARD_JS_ETAG = hashlib.blake2b(_DASHBOARD_JS_BYTES, digest_size=8).hexdigest()
+_DASHBOARD_JS_ENCODED = _precompress(_DASHBOARD_JS_BYTES)
+
+_DASHBOARD_BYTES = (
+    _minify_style_blocks(_DASHBOARD_HTML)
+    .replace("__DASHBOARD_JS_URL__", f"/marketapi/static/dashboard.{_DASHBOARD_JS_ETAG}.js")
+    .encode("utf-8")
+)
+_DASHBOARD_ETAG = hashlib.blake2b(_DASHBOARD_BYTES, digest_size=8).hexdigest()
+_DASHBOARD_ENCODED = _precompress(_DASHBOARD_BYTES)
+
+# Sent as a header so the CDN connection and the script fetch start before
+# the browser has parsed any of the body
+_DASHBOARD_LINK = ", ".join((
+    "<https://cdn.jsdelivr.net>; rel=preconnect",
+    f"</marketapi/static/dashboard.{_DASHBOARD_JS_ETAG}.js>; rel=preload; as=script",
+))
+
+
+@app.route("/")
+@app.route("/marketapi")
+@app.route("/dashboard")
+@auth.login_required
+def dashboard():
+    """Serve the dashboard page, precompressed when the client accepts it."""
+    response = _send_precompressed(
+        _DASHBOARD_BYTES, _DASHBOARD_ENCODED, _DASHBOARD_ETAG,
+        mimetype="text/html", cache_control="private, max-age=300"
+    )
+    response.headers["Link"] = _DASHBOARD_LINK
+    return response
+
+
+@app.route("/marketapi/static/dashboard.<version>.js")
+@auth.login_required
+def dashboard_script(version):
+    """Serve the dashboard script; its URL changes whenever the content does."""
+    if version != _DASHBOARD_JS_ETAG:
+        return jsonify({"error": "Not found"}), 404
+    return _send_precompressed(
+        _DASHBOARD_JS_BYTES, _DASHBOARD_JS_ENCODED, _DASHBOARD_JS_ETAG,
+        mimetype="text/javascript", cache_control="private, max-age=31536000, immutable"
+    )
+
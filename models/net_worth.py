@@ -5,13 +5,17 @@ This module defines the schema for net worth tracking data imported from Google
 Schema is based on the actual columns in the user's net worth tracking spreadsheet.
 """
 
+import json
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, List
+from functools import cached_property
+from operator import attrgetter
+from typing import Any, Callable, Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class NetWorthEntry:
     """
     A single net worth snapshot entry - one row from the Google Sheet.
@@ -97,39 +101,41 @@ class NetWorthEntry:
         return {k: v for k, v in accounts.items() if v is not None}
     
     def to_dict(self) -> dict:
-        """Convert entry to dictionary for JSON serialization."""
-        def decimal_to_str(val):
-            return str(val) if val is not None else None
+        """
+        Convert entry to dictionary for JSON serialization.
         
+        Decimal fields are stringified inline rather than through a helper:
+        this runs once per row per export, and the per-field call dominated.
+        """
         return {
             "date": self.date.isoformat(),
             # Account balances
-            "etrade": decimal_to_str(self.etrade),
-            "crypto": decimal_to_str(self.crypto),
-            "nfts": decimal_to_str(self.nfts),
-            "capital_one": decimal_to_str(self.capital_one),
-            "thinkorswim": decimal_to_str(self.thinkorswim),
-            "tradestation": decimal_to_str(self.tradestation),
-            "fidelity": decimal_to_str(self.fidelity),
-            "car": decimal_to_str(self.car),
-            "misc": decimal_to_str(self.misc),
-            "tax_correction": decimal_to_str(self.tax_correction),
-            "inheritance": decimal_to_str(self.inheritance),
+            "etrade": None if self.etrade is None else str(self.etrade),
+            "crypto": None if self.crypto is None else str(self.crypto),
+            "nfts": None if self.nfts is None else str(self.nfts),
+            "capital_one": None if self.capital_one is None else str(self.capital_one),
+            "thinkorswim": None if self.thinkorswim is None else str(self.thinkorswim),
+            "tradestation": None if self.tradestation is None else str(self.tradestation),
+            "fidelity": None if self.fidelity is None else str(self.fidelity),
+            "car": None if self.car is None else str(self.car),
+            "misc": None if self.misc is None else str(self.misc),
+            "tax_correction": None if self.tax_correction is None else str(self.tax_correction),
+            "inheritance": None if self.inheritance is None else str(self.inheritance),
             # Calculated fields
-            "semi_liquid_assets": decimal_to_str(self.semi_liquid_assets),
-            "investible_assets": decimal_to_str(self.investible_assets),
-            "net_worth": decimal_to_str(self.net_worth),
-            "net_worth_change": decimal_to_str(self.net_worth_change),
+            "semi_liquid_assets": None if self.semi_liquid_assets is None else str(self.semi_liquid_assets),
+            "investible_assets": None if self.investible_assets is None else str(self.investible_assets),
+            "net_worth": None if self.net_worth is None else str(self.net_worth),
+            "net_worth_change": None if self.net_worth_change is None else str(self.net_worth_change),
             "days_since_last": self.days_since_last,
-            "daily_net_worth_change": decimal_to_str(self.daily_net_worth_change),
-            "ytd_change_dollars": decimal_to_str(self.ytd_change_dollars),
-            "ytd_change_percent": decimal_to_str(self.ytd_change_percent),
-            "withdrawal_3_percent": decimal_to_str(self.withdrawal_3_percent),
-            "withdrawal_4_percent": decimal_to_str(self.withdrawal_4_percent),
-            "growth_8_percent": decimal_to_str(self.growth_8_percent),
-            "living_expenses": decimal_to_str(self.living_expenses),
-            "retirement_spending": decimal_to_str(self.retirement_spending),
-            "cof_comp": decimal_to_str(self.cof_comp),
+            "daily_net_worth_change": None if self.daily_net_worth_change is None else str(self.daily_net_worth_change),
+            "ytd_change_dollars": None if self.ytd_change_dollars is None else str(self.ytd_change_dollars),
+            "ytd_change_percent": None if self.ytd_change_percent is None else str(self.ytd_change_percent),
+            "withdrawal_3_percent": None if self.withdrawal_3_percent is None else str(self.withdrawal_3_percent),
+            "withdrawal_4_percent": None if self.withdrawal_4_percent is None else str(self.withdrawal_4_percent),
+            "growth_8_percent": None if self.growth_8_percent is None else str(self.growth_8_percent),
+            "living_expenses": None if self.living_expenses is None else str(self.living_expenses),
+            "retirement_spending": None if self.retirement_spending is None else str(self.retirement_spending),
+            "cof_comp": None if self.cof_comp is None else str(self.cof_comp),
             "notes": self.notes,
         }
 
@@ -172,38 +178,151 @@ class NetWorthDataset:
     Complete net worth tracking dataset from Google Sheets.
     
     Contains the time series of net worth entries and metadata about the source.
+    
+    A loaded dataset is treated as read-only: derived views such as
+    sorted_entries are computed on first use and then reused.
     """
     entries: List[NetWorthEntry] = field(default_factory=list)
     source_sheet_id: Optional[str] = None
     source_sheet_name: Optional[str] = None
     last_updated: Optional[datetime] = None
+    _derived: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    @cached_property
+    def sorted_entries(self) -> List[NetWorthEntry]:
+        """Entries ordered by date (oldest first)."""
+        return sorted(self.entries, key=attrgetter("date"))
+    
+    @cached_property
+    def dates(self) -> List[date]:
+        """Dates of sorted_entries, in the same order."""
+        return [entry.date for entry in self.sorted_entries]
+    
+    @cached_property
+    def date_labels(self) -> List[str]:
+        """ISO-formatted dates of sorted_entries, for chart labels."""
+        return [d.isoformat() for d in self.dates]
+    
+    @cached_property
+    def entries_json(self) -> List[str]:
+        """
+        Compact JSON of each entry's to_dict(), in sorted_entries order.
+        
+        Lets the API splice a date-range slice into a response without
+        rebuilding and re-encoding every entry dict on each request.
+        """
+        return [
+            json.dumps(entry.to_dict(), separators=(",", ":"))
+            for entry in self.sorted_entries
+        ]
+    
+    @cached_property
+    def latest_index(self) -> Optional[int]:
+        """
+        Position in sorted_entries of the entry get_latest_entry() returns.
+        
+        When several entries share the latest date this is the first of
+        them, as max() would pick.
+        """
+        if not self.entries:
+            return None
+        return bisect_left(self.dates, self.dates[-1])
+    
+    @cached_property
+    def entries_by_date(self) -> dict[date, NetWorthEntry]:
+        """
+        Entries keyed by date, for get_entry_by_date().
+        
+        Built from the end of entries backwards so that, when several entries
+        share a date, the first one in entries wins, as a forward scan would.
+        """
+        return {entry.date: entry for entry in reversed(self.entries)}
+    
+    def column(self, attr: str) -> List[Any]:
+        """
+        Get one field of every entry, in sorted_entries order.
+        
+        Columns are built once per attr and shared by every caller, so they
+        must not be modified in place.
+        
+        Args:
+            attr: NetWorthEntry attribute name (e.g. 'etrade', 'net_worth')
+        """
+        key = ("column", attr)
+        column = self._derived.get(key)
+        if column is None:
+            column = self._derived[key] = list(map(attrgetter(attr), self.sorted_entries))
+        return column
+    
+    def float_column(self, attr: str, missing: Optional[float] = None) -> List[Optional[float]]:
+        """
+        Get one field of every entry as floats, in sorted_entries order.
+        
+        Columns are built once per (attr, missing) pair and shared by every
+        caller, so they must not be modified in place.
+        
+        Args:
+            attr: NetWorthEntry attribute name (e.g. 'etrade', 'net_worth')
+            missing: Value used where the entry has no value for attr
+        """
+        key = ("float_column", attr, missing)
+        column = self._derived.get(key)
+        if column is None:
+            column = [
+                missing if value is None else float(value)
+                for value in self.column(attr)
+            ]
+            self._derived[key] = column
+        return column
+    
+    def memoize(self, build: Callable[["NetWorthDataset"], Any]) -> Any:
+        """
+        Get build(self), computing it only on the first call for this dataset.
+        
+        For views derived outside this module (such as API payloads) that
+        only depend on the dataset. Results are shared by every caller and
+        must not be modified in place.
+        """
+        try:
+            return self._derived[build]
+        except KeyError:
+            value = self._derived[build] = build(self)
+            return value
+    
+    def date_index_range(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> tuple[int, int]:
+        """
+        Get the [lo, hi) slice of sorted_entries within a date range (inclusive).
+        
+        Either bound may be None to leave that side of the range open.
+        """
+        dates = self.dates
+        lo = bisect_left(dates, start_date) if start_date else 0
+        hi = bisect_right(dates, end_date) if end_date else len(dates)
+        return lo, max(lo, hi)
     
     def get_latest_entry(self) -> Optional[NetWorthEntry]:
         """Get the most recent net worth entry."""
         if not self.entries:
             return None
-        return max(self.entries, key=lambda e: e.date)
+        return self.sorted_entries[self.latest_index]
     
     def get_entry_by_date(self, target_date: date) -> Optional[NetWorthEntry]:
         """Get net worth entry for a specific date."""
-        for entry in self.entries:
-            if entry.date == target_date:
-                return entry
-        return None
+        return self.entries_by_date.get(target_date)
     
     def get_entries_in_range(self, start_date: date, end_date: date) -> List[NetWorthEntry]:
         """Get all entries within a date range (inclusive)."""
-        return sorted(
-            [entry for entry in self.entries if start_date <= entry.date <= end_date],
-            key=lambda e: e.date
-        )
+        lo, hi = self.date_index_range(start_date, end_date)
+        return self.sorted_entries[lo:hi]
     
     def get_net_worth_series(self) -> List[tuple[date, Decimal]]:
         """Get time series of (date, net_worth) tuples for charting."""
         return [
-            (entry.date, entry.net_worth)
-            for entry in sorted(self.entries, key=lambda e: e.date)
-            if entry.net_worth is not None
+            (entry_date, net_worth)
+            for entry_date, net_worth in zip(self.dates, self.column("net_worth"))
+            if net_worth is not None
         ]
     
     def to_dict(self) -> dict:
@@ -17,9 +17,15 @@ For private sheets, you'll need to set up a Google Cloud Service Account:
 import os
 import json
 import logging
-from datetime import datetime, date
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import datetime, date, timedelta
 from decimal import Decimal, InvalidOperation
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Callable
+
+import orjson
 
 from models.net_worth import NetWorthEntry, NetWorthDataset, COLUMN_MAPPING
 
@@ -31,6 +37,56 @@ class GoogleSheetsError(Exception):
     pass
 
 
+# Date formats tried for text cells, in order of precedence
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%m/%d/%y",
+    "%d/%m/%Y",
+    "%Y/%m/%d",
+    "%B %d, %Y",
+    "%b %d, %Y",
+)
+
+# Date text shapes and the only formats from _DATE_FORMATS that can match
+# them, in the same order; anything else tries every format
+_DATE_SHAPES = (
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), ("%Y-%m-%d",)),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), ("%m/%d/%Y", "%d/%m/%Y")),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{2}"), ("%m/%d/%y",)),
+    (re.compile(r"\d{4}/\d{1,2}/\d{1,2}"), ("%Y/%m/%d",)),
+    # Serial numbers contain none of the formats' separators
+    (re.compile(r"[+-]?\d*\.?\d*"), ()),
+)
+
+# Numeric text that int(float(...)) accepts, checked up front so cells
+# holding other text are rejected without raising
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Google Sheets uses December 30, 1899 as day 0
+_SERIAL_DATE_BASE = date(1899, 12, 30)
+
+
+def _response_model():
+    """Get the API client model used to decode responses, backed by orjson."""
+    from googleapiclient.model import JsonModel
+    
+    class OrjsonModel(JsonModel):
+        """JsonModel that decodes response bodies with orjson."""
+        
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Same fallback as JsonModel: hand back the raw text
+                return content.decode("utf-8") if isinstance(content, bytes) else content
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+    
+    return OrjsonModel()
+
+
 class GoogleSheetsService:
     """
     Service for reading data from Google Sheets.
@@ -130,7 +186,7 @@ class GoogleSheetsService:
             )
         
         credentials = self._get_credentials()
-        self._service = build("sheets", "v4", credentials=credentials)
+        self._service = build("sheets", "v4", credentials=credentials, model=_response_model())
         return self._service
     
     def _parse_date(self, value: Any) -> Optional[date]:
@@ -141,20 +197,23 @@ class GoogleSheetsService:
         if isinstance(value, date):
             return value
         
-        value_str = str(value).strip()
-        if not value_str:
-            return None
-        
-        # Try common date formats
-        formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%m/%d/%y",
-            "%d/%m/%Y",
-            "%Y/%m/%d",
-            "%B %d, %Y",
-            "%b %d, %Y",
-        ]
+        value_type = type(value)
+        if value_type is int or value_type is float:
+            # Date cells arrive as serial numbers (SERIAL_NUMBER render option)
+            value_str = str(value)
+            formats = ()
+        else:
+            value_str = str(value).strip()
+            if not value_str:
+                return None
+            
+            # Only try the formats the text's shape allows, rather than
+            # failing through the list with an exception per format
+            for shape, formats in _DATE_SHAPES:
+                if shape.fullmatch(value_str):
+                    break
+            else:
+                formats = _DATE_FORMATS
         
         for fmt in formats:
             try:
@@ -165,10 +224,7 @@ class GoogleSheetsService:
         # Try parsing as a serial date (Excel/Sheets format)
         try:
             serial = float(value_str)
-            # Google Sheets uses December 30, 1899 as day 0
-            from datetime import timedelta
-            base_date = date(1899, 12, 30)
-            return base_date + timedelta(days=int(serial))
+            return _SERIAL_DATE_BASE + timedelta(days=int(serial))
         except (ValueError, OverflowError):
             pass
         
@@ -177,6 +233,13 @@ class GoogleSheetsService:
     
     def _parse_decimal(self, value: Any) -> Optional[Decimal]:
         """Parse a decimal value from the spreadsheet."""
+        # Numeric cells already arrive as int/float (UNFORMATTED_VALUE)
+        value_type = type(value)
+        if value_type is int:
+            return Decimal(value)
+        if value_type is float:
+            return Decimal(str(value))
+        
         if value is None or value == "":
             return None
         
@@ -207,18 +270,39 @@ class GoogleSheetsService:
     
     def _parse_int(self, value: Any) -> Optional[int]:
         """Parse an integer value from the spreadsheet."""
+        value_type = type(value)
+        if value_type is int:
+            return value
+        if value_type is float:
+            # NaN is the one float int() rejects with ValueError
+            return int(value) if value == value else None
         if value is None or value == "":
             return None
         
-        try:
-            return int(float(str(value).strip()))
-        except (ValueError, TypeError):
+        value_str = str(value).strip()
+        if not _NUMBER_RE.fullmatch(value_str):
             return None
+        return int(float(value_str))
+    
+    @staticmethod
+    def _parse_text(value: Any) -> Optional[str]:
+        """Parse a free-text value from the spreadsheet."""
+        return str(value) if value else None
+    
+    def _column_parser(self, attr_name: str) -> Callable[[Any], Any]:
+        """Get the cell parser for a NetWorthEntry attribute."""
+        if attr_name == "notes":
+            return self._parse_text
+        if attr_name == "days_since_last":
+            return self._parse_int
+        # All other fields are decimals
+        return self._parse_decimal
     
     def read_sheet(
         self,
         sheet_name: Optional[str] = None,
-        range_notation: Optional[str] = None
+        range_notation: Optional[str] = None,
+        major_dimension: str = "ROWS"
     ) -> List[List[Any]]:
         """
         Read raw data from a Google Sheet.
@@ -226,9 +310,12 @@ class GoogleSheetsService:
         Args:
             sheet_name: Name of the sheet tab (uses default if not provided)
             range_notation: A1 notation for the range (e.g., "A1:Z100")
+            major_dimension: "ROWS" or "COLUMNS", the direction of the
+                             returned lists
         
         Returns:
-            List of rows, where each row is a list of cell values
+            List of rows (or columns, with major_dimension="COLUMNS"), each a
+            list of cell values with trailing empty cells omitted
         """
         service = self._get_service()
         
@@ -243,8 +330,11 @@ class GoogleSheetsService:
             result = service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
                 range=full_range,
+                majorDimension=major_dimension,
                 valueRenderOption="UNFORMATTED_VALUE",
-                dateTimeRenderOption="SERIAL_NUMBER"
+                dateTimeRenderOption="SERIAL_NUMBER",
+                # Skip the range and dimension echoed back with the values
+                fields="values"
             ).execute()
             
             return result.get("values", [])
@@ -264,13 +354,15 @@ class GoogleSheetsService:
         Returns:
             NetWorthDataset with all entries from the sheet
         """
-        rows = self.read_sheet(sheet_name=sheet_name)
+        # Read column-major: parsing works a column at a time, so this
+        # avoids transposing the rows here
+        columns = self.read_sheet(sheet_name=sheet_name, major_dimension="COLUMNS")
         
-        if not rows:
+        if not columns:
             raise GoogleSheetsError("Sheet is empty")
         
-        # First row is headers
-        headers = [str(h).strip() for h in rows[0]]
+        # First cell of each column is its header
+        headers = [str(column[0]).strip() if column else "" for column in columns]
         
         # Map headers to column indices
         header_to_index = {h: i for i, h in enumerate(headers)}
@@ -281,50 +373,40 @@ class GoogleSheetsService:
             if sheet_col in header_to_index:
                 attr_to_index[attr_name] = header_to_index[sheet_col]
         
-        entries = []
-        
-        # Process data rows (skip header)
-        for row_num, row in enumerate(rows[1:], start=2):
-            # Skip empty rows
-            if not row or all(cell == "" or cell is None for cell in row):
-                continue
-            
-            # Get date first - skip rows without valid dates
-            date_idx = attr_to_index.get("date")
-            if date_idx is None or date_idx >= len(row):
-                continue
-            
-            entry_date = self._parse_date(row[date_idx])
+        # Keep the data rows (skip header) that have a valid date
+        date_idx = attr_to_index.get("date")
+        date_cells = columns[date_idx] if date_idx is not None else []
+        # Positions within each column; the sheet row number is one higher
+        kept, dates = [], []
+        for i in range(1, len(date_cells)):
+            entry_date = self._parse_date(date_cells[i])
             if not entry_date:
-                logger.debug(f"Skipping row {row_num}: no valid date")
+                if date_cells[i]:
+                    logger.debug(f"Skipping row {i + 1}: no valid date")
                 continue
             
-            # Build entry kwargs
-            entry_kwargs = {"date": entry_date}
-            
-            for attr_name, col_idx in attr_to_index.items():
-                if attr_name == "date":
-                    continue
-                
-                if col_idx >= len(row):
-                    continue
-                
-                value = row[col_idx]
-                
-                # Determine the type based on attribute name
-                if attr_name == "notes":
-                    entry_kwargs[attr_name] = str(value) if value else None
-                elif attr_name == "days_since_last":
-                    entry_kwargs[attr_name] = self._parse_int(value)
-                else:
-                    # All other fields are decimals
-                    entry_kwargs[attr_name] = self._parse_decimal(value)
-            
+            kept.append(i)
+            dates.append(entry_date)
+        
+        # Parse column by column: each column's parser is picked once and
+        # mapped over the cells of the kept rows. Cells past the end of a
+        # short column parse as None, the field default.
+        attrs = [attr_name for attr_name in attr_to_index if attr_name != "date"]
+        parsed_columns = []
+        for attr_name in attrs:
+            column = columns[attr_to_index[attr_name]]
+            size = len(column)
+            cells = [column[i] if i < size else None for i in kept]
+            parsed_columns.append(list(map(self._column_parser(attr_name), cells)))
+        
+        entries = []
+        values_by_row = zip(*parsed_columns) if parsed_columns else [()] * len(dates)
+        for i, entry_date, values in zip(kept, dates, values_by_row):
             try:
-                entry = NetWorthEntry(**entry_kwargs)
+                entry = NetWorthEntry(date=entry_date, **dict(zip(attrs, values)))
                 entries.append(entry)
             except Exception as e:
-                logger.warning(f"Failed to create entry for row {row_num}: {e}")
+                logger.warning(f"Failed to create entry for row {i + 1}: {e}")
         
         dataset = NetWorthDataset(
             entries=entries,
@@ -355,3 +437,133 @@ def load_net_worth_from_sheets(
     """
     service = GoogleSheetsService(spreadsheet_id=spreadsheet_id)
     return service.load_net_worth_data(sheet_name=sheet_name)
+
+
+# Parsed datasets are kept in-process for a short time so API requests do
+# not each make a round-trip to the Google Sheets API
+NET_WORTH_CACHE_TTL_SECONDS = float(os.environ.get("NET_WORTH_CACHE_TTL_SECONDS", "60"))
+# For this long past the TTL, the old dataset keeps being served while a
+# single background refresh runs
+NET_WORTH_CACHE_STALE_SECONDS = float(os.environ.get("NET_WORTH_CACHE_STALE_SECONDS", "300"))
+# How long a request waits on an in-flight Sheets load before giving up
+NET_WORTH_LOAD_TIMEOUT_SECONDS = float(os.environ.get("NET_WORTH_LOAD_TIMEOUT_SECONDS", "30"))
+# Whether serving workers start loading the default dataset as soon as they
+# boot (see gunicorn.conf.py), so the first request does not pay for the
+# Sheets round-trip
+NET_WORTH_PREFETCH = os.environ.get("NET_WORTH_PREFETCH", "true").lower() == "true"
+
+_dataset_cache = {}  # (spreadsheet_id, sheet_name) -> (loaded_at, NetWorthDataset)
+_dataset_loads = {}  # (spreadsheet_id, sheet_name) -> Future of the in-flight load
+_dataset_cache_lock = threading.Lock()
+_dataset_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets-loader")
+# Sheets clients by spreadsheet ID, kept across loads so credentials, the API
+# client and its HTTP connection are set up once. Only the loader thread uses
+# them, which matters because httplib2 connections are not thread-safe.
+_sheets_services = {}
+
+
+def _load_and_cache_dataset(key: tuple) -> NetWorthDataset:
+    """Load a dataset on the loader thread and publish it to the cache."""
+    try:
+        service = _sheets_services.get(key[0])
+        if service is None:
+            service = _sheets_services[key[0]] = GoogleSheetsService(spreadsheet_id=key[0])
+        dataset = service.load_net_worth_data(sheet_name=key[1])
+        with _dataset_cache_lock:
+            _dataset_cache[key] = (time.monotonic(), dataset)
+        return dataset
+    except Exception as e:
+        # Background refreshes have no caller to report to
+        logger.warning(f"Refreshing net worth data from Google Sheets failed: {e}")
+        raise
+    finally:
+        with _dataset_cache_lock:
+            _dataset_loads.pop(key, None)
+
+
+def _start_dataset_load(key: tuple) -> Future:
+    """Get the in-flight load for key, starting one if needed (hold _dataset_cache_lock)."""
+    load = _dataset_loads.get(key)
+    if load is None:
+        load = _dataset_loader.submit(_load_and_cache_dataset, key)
+        _dataset_loads[key] = load
+    return load
+
+
+def get_cached_net_worth_dataset(
+    spreadsheet_id: Optional[str] = None,
+    sheet_name: Optional[str] = None,
+    ttl: Optional[float] = None,
+    stale_ttl: Optional[float] = None
+) -> NetWorthDataset:
+    """
+    Load net worth data, reusing a recently loaded dataset when possible.
+    
+    A dataset older than ttl but still within stale_ttl after that is
+    returned as-is while one background refresh replaces it
+    (stale-while-revalidate). With no usable dataset, the first caller
+    starts one load on a background thread and every concurrent caller
+    waits on that same load, so a burst of requests makes a single Sheets
+    API call. The returned dataset is shared between requests and must be
+    treated as read-only.
+    
+    Args:
+        spreadsheet_id: Optional spreadsheet ID (uses default if not provided)
+        sheet_name: Optional sheet name (uses default if not provided)
+        ttl: Maximum age in seconds of a fresh cached dataset
+             (defaults to NET_WORTH_CACHE_TTL_SECONDS)
+        stale_ttl: Seconds past ttl during which a stale dataset is still
+                   served (defaults to NET_WORTH_CACHE_STALE_SECONDS)
+    
+    Returns:
+        NetWorthDataset with all entries
+    
+    Raises:
+        GoogleSheetsError: If the load fails or does not finish within
+                           NET_WORTH_LOAD_TIMEOUT_SECONDS
+    """
+    ttl = NET_WORTH_CACHE_TTL_SECONDS if ttl is None else ttl
+    stale_ttl = NET_WORTH_CACHE_STALE_SECONDS if stale_ttl is None else stale_ttl
+    key = (spreadsheet_id, sheet_name)
+    
+    cached = _dataset_cache.get(key)
+    if cached:
+        age = time.monotonic() - cached[0]
+        if age < ttl:
+            return cached[1]
+        if age < ttl + stale_ttl:
+            with _dataset_cache_lock:
+                _start_dataset_load(key)
+            return cached[1]
+    
+    with _dataset_cache_lock:
+        # Another request may have refreshed the entry while we waited
+        cached = _dataset_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        load = _start_dataset_load(key)
+    
+    try:
+        return load.result(timeout=NET_WORTH_LOAD_TIMEOUT_SECONDS)
+    except FuturesTimeoutError:
+        raise GoogleSheetsError(
+            f"Timed out after {NET_WORTH_LOAD_TIMEOUT_SECONDS:g}s waiting for Google Sheets data"
+        )
+
+
+def prefetch_net_worth_dataset(
+    spreadsheet_id: Optional[str] = None,
+    sheet_name: Optional[str] = None
+) -> None:
+    """
+    Start loading a dataset in the background without waiting for it.
+    
+    Requests that arrive while the load is running wait on it like any
+    other in-flight load. Failures are logged by the loader thread and the
+    next request retries.
+    """
+    key = (spreadsheet_id, sheet_name)
+    with _dataset_cache_lock:
+        if key not in _dataset_cache:
+            _start_dataset_load(key)
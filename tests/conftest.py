@@ -0,0 +1,96 @@
+"""
+Shared fixtures: a stub Google Sheets API and a clean dataset cache.
+"""
+
+import base64
+import os
+import threading
+
+import pytest
+
+# auth reads its credentials once at import, so they must be set before
+# main (and with it auth) is first imported by any test module
+os.environ["API_USERNAME"] = "test-user"
+os.environ["API_PASSWORD"] = "test-password"
+os.environ.pop("API_PASSWORD_HASH", None)
+
+import services.google_sheets as google_sheets
+
+
+# Header row plus three entries; dates are Sheets serial numbers
+# (45292 = 2024-01-01), as the SERIAL_NUMBER render option returns them
+SHEET_ROWS = [
+    ["Date", "Net Worth", "Investible Assets", "Days Since Last", "Notes"],
+    [45292, 1000, 800.5, "", "start"],
+    [45323, 1500.25, 900, 31],
+    [45352, 2000, 1200, 29, "latest"],
+]
+
+
+class StubSheetsService:
+    """
+    Stands in for the googleapiclient Sheets resource.
+
+    Counts every values().get().execute() call. While `gate` is cleared,
+    execute() blocks, which holds a load in flight; `started` is set as soon
+    as a call begins.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+        self.started = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+        self._lock = threading.Lock()
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, majorDimension="ROWS", **kwargs):
+        self._major_dimension = majorDimension
+        return self
+
+    def execute(self):
+        with self._lock:
+            self.calls += 1
+        self.started.set()
+        assert self.gate.wait(timeout=5), "stub Sheets call was never released"
+        if self._major_dimension == "COLUMNS":
+            width = max(len(row) for row in self.rows)
+            columns = [[row[i] if i < len(row) else "" for row in self.rows] for i in range(width)]
+            return {"values": columns}
+        return {"values": self.rows}
+
+
+def _reset_dataset_cache():
+    with google_sheets._dataset_cache_lock:
+        google_sheets._dataset_cache.clear()
+        google_sheets._dataset_loads.clear()
+    google_sheets._sheets_services.clear()
+
+
+@pytest.fixture
+def sheets(monkeypatch):
+    """Route every GoogleSheetsService to a fresh stub and start with an empty cache."""
+    stub = StubSheetsService(SHEET_ROWS)
+    monkeypatch.setattr(google_sheets.GoogleSheetsService, "_get_service", lambda self: stub)
+    _reset_dataset_cache()
+    yield stub
+    # Never leave the shared loader thread blocked for the next test
+    stub.gate.set()
+    _reset_dataset_cache()
+
+
+@pytest.fixture
+def client(sheets):
+    """Flask test client that sends the test credentials."""
+    import main
+
+    token = base64.b64encode(b"test-user:test-password").decode()
+    test_client = main.app.test_client()
+    test_client.environ_base["HTTP_AUTHORIZATION"] = f"Basic {token}"
+    return test_client
@@ -0,0 +1,208 @@
+"""
+Tests for Basic Auth verification in auth.py, driven through the Flask app.
+
+conftest configures a plain API_PASSWORD. Tests of hashed mode switch the
+module to API_PASSWORD_HASH with the hashed_password fixture.
+"""
+
+import base64
+
+import pytest
+from werkzeug.security import check_password_hash, generate_password_hash
+
+import auth
+import main
+
+# Cheap werkzeug parameters keep the hashed-mode tests fast
+FAST_PBKDF2 = "pbkdf2:sha256:1000"
+
+
+def get_as(username, password, path="/dashboard"):
+    """Request a protected page with Basic Auth from a fresh client (no session)."""
+    token = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
+    return main.app.test_client().get(path, headers={"Authorization": f"Basic {token}"})
+
+
+@pytest.fixture
+def hashed_password(monkeypatch):
+    """Switch auth to hashed mode; call the result with the hash to configure."""
+    def configure(password_hash):
+        monkeypatch.setattr(auth, "_AUTH_MODE", auth._AuthMode.HASHED)
+        monkeypatch.setattr(auth, "API_PASSWORD_HASH", password_hash)
+        monkeypatch.setattr(auth, "_PARSED_PASSWORD_HASH", auth._parse_werkzeug_hash(password_hash))
+        auth.invalidate_auth_cache()
+
+    yield configure
+    auth.invalidate_auth_cache()
+
+
+@pytest.fixture
+def hash_checks(monkeypatch):
+    """Count full checks of the configured password hash."""
+    calls = []
+    check = auth._check_configured_password_hash
+
+    def counting_check(password):
+        calls.append(password)
+        return check(password)
+
+    monkeypatch.setattr(auth, "_check_configured_password_hash", counting_check)
+    return calls
+
+
+def test_successful_hash_check_is_cached(hashed_password, hash_checks):
+    hashed_password(generate_password_hash("s3cret", FAST_PBKDF2))
+
+    assert get_as("test-user", "s3cret").status_code == 200
+    assert get_as("test-user", "s3cret").status_code == 200
+
+    assert len(hash_checks) == 1
+
+
+def test_failed_hash_check_is_not_cached(hashed_password, hash_checks):
+    hashed_password(generate_password_hash("s3cret", FAST_PBKDF2))
+
+    assert get_as("test-user", "wrong").status_code == 401
+    assert get_as("test-user", "wrong").status_code == 401
+
+    assert len(hash_checks) == 2
+    assert not auth._auth_cache
+
+
+def test_expired_entry_is_checked_again(hashed_password, hash_checks):
+    hashed_password(generate_password_hash("s3cret", FAST_PBKDF2))
+    assert get_as("test-user", "s3cret").status_code == 200
+
+    digest = auth._credential_digest("test-user", "s3cret")
+    auth._auth_cache[digest] = 0.0
+
+    assert get_as("test-user", "s3cret").status_code == 200
+    assert len(hash_checks) == 2
+
+
+def test_cache_evicts_least_recently_used(hashed_password, monkeypatch):
+    hashed_password(generate_password_hash("s3cret", FAST_PBKDF2))
+    monkeypatch.setattr(auth, "AUTH_CACHE_MAX_ENTRIES", 2)
+
+    for username in ("a", "b", "a", "c"):
+        assert auth._check_password_hash_cached(username, "s3cret")
+
+    assert list(auth._auth_cache) == [
+        auth._credential_digest("a", "s3cret"),
+        auth._credential_digest("c", "s3cret"),
+    ]
+
+
+def test_new_hashes_are_argon2id():
+    assert auth.get_password_hash("s3cret").startswith("$argon2id$")
+
+
+def test_argon2_hash_is_verified_with_argon2(hashed_password):
+    hashed_password(auth.get_password_hash("s3cret"))
+
+    # argon2 hashes are not pre-parsed; they go through argon2-cffi
+    assert auth._PARSED_PASSWORD_HASH is None
+    assert get_as("test-user", "s3cret").status_code == 200
+    assert get_as("test-user", "wrong").status_code == 401
+
+
+def test_legacy_werkzeug_hash_still_verifies(hashed_password):
+    hashed_password(generate_password_hash("s3cret", FAST_PBKDF2))
+
+    assert get_as("test-user", "s3cret").status_code == 200
+    assert get_as("test-user", "wrong").status_code == 401
+
+
+def test_malformed_argon2_hash_rejects_instead_of_raising(hashed_password):
+    hashed_password("$argon2id$not-a-hash")
+
+    assert get_as("test-user", "s3cret").status_code == 401
+
+
+def test_successful_logins_are_counted():
+    before = auth.auth_success_count()
+
+    assert get_as("test-user", "test-password").status_code == 200
+    assert get_as("test-user", "wrong").status_code == 401
+    assert get_as("test-user", "test-password").status_code == 200
+
+    assert auth.auth_success_count() == before + 2
+
+
+PREPARSED_METHODS = [FAST_PBKDF2, "pbkdf2:sha512:1000", "scrypt:1024:8:1"]
+CANDIDATE_PASSWORDS = ["s3cret", "s3cret ", "S3cret", "", "pässwörd", "s3cret" * 50]
+
+
+@pytest.mark.parametrize("method", PREPARSED_METHODS)
+def test_preparsed_hash_matches_check_password_hash(method):
+    for stored in ("s3cret", "pässwörd"):
+        password_hash = generate_password_hash(stored, method)
+        derive, expected = auth._parse_werkzeug_hash(password_hash)
+
+        for candidate in CANDIDATE_PASSWORDS:
+            assert (derive(candidate.encode("utf-8")) == expected) == check_password_hash(
+                password_hash, candidate
+            ), (method, stored, candidate)
+
+
+@pytest.mark.parametrize("password_hash", [
+    "$argon2id$v=19$m=4096,t=3,p=1$c2FsdA$aGFzaA",
+    "pbkdf2:sha256$salt$00",
+    "plain:sha256:1000$salt$00",
+    "pbkdf2:sha256:many$salt$00",
+    "pbkdf2:sha256:1000$salt$not-hex",
+    "no-dollar-signs",
+])
+def test_other_hash_formats_are_not_preparsed(password_hash):
+    assert auth._parse_werkzeug_hash(password_hash) is None
+
+
+@pytest.mark.parametrize("method", PREPARSED_METHODS)
+def test_preparsed_hash_authenticates_requests(hashed_password, method):
+    hashed_password(generate_password_hash("s3cret", method))
+
+    assert auth._PARSED_PASSWORD_HASH is not None
+    assert get_as("test-user", "s3cret").status_code == 200
+    assert get_as("test-user", "S3cret").status_code == 401
+
+
+def test_unauthorized_response_is_not_cacheable():
+    missing = main.app.test_client().get("/dashboard")
+    wrong = get_as("test-user", "wrong")
+
+    for response in (missing, wrong):
+        assert response.status_code == 401
+        assert response.headers["Cache-Control"] == "no-store"
+        assert "Authorization" in response.vary
+        assert response.get_json()["status"] == 401
+
+
+@pytest.mark.parametrize("provided, expected", [
+    ("test-user", True),
+    ("test-use", False),
+    ("test-user-and-more", False),
+    ("", False),
+    (None, False),
+    ("tëst-user", False),
+])
+def test_secure_compare(provided, expected):
+    assert auth._secure_compare(provided, auth._USERNAME_DIGEST) is expected
+
+
+def test_credentials_are_compared_as_fixed_length_digests(monkeypatch):
+    compared = []
+    compare_digest = auth.hmac.compare_digest
+
+    def recording_compare(a, b):
+        compared.append((len(a), len(b)))
+        return compare_digest(a, b)
+
+    monkeypatch.setattr(auth.hmac, "compare_digest", recording_compare)
+
+    assert get_as("u", "test-password").status_code == 401
+    assert get_as("test-user" * 20, "test-password").status_code == 401
+    assert get_as("test-user", "x").status_code == 401
+    assert get_as("test-user", "test-password").status_code == 200
+
+    assert compared
+    assert set(compared) == {(32, 32)}
@@ -0,0 +1,83 @@
+"""
+Tests for on-the-fly compression of JSON API responses.
+"""
+
+import gzip
+
+import brotli
+import pytest
+from flask import Response
+
+import main
+
+RETIREMENT = "/marketapi/v1/networth/retirement"
+
+
+def decode(response):
+    body = response.get_data()
+    encoding = response.headers.get("Content-Encoding")
+    if encoding == "br":
+        return brotli.decompress(body)
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br", "br"),
+    ("br;q=0.5, gzip", "br"),
+    ("gzip", "gzip"),
+    ("identity", None),
+    ("br;q=0, gzip", "gzip"),
+])
+def test_negotiates_brotli_then_gzip(client, accept_encoding, expected):
+    plain = client.get(RETIREMENT, headers={"Accept-Encoding": "identity"})
+    response = client.get(RETIREMENT, headers={"Accept-Encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") == expected
+    assert "Accept-Encoding" in response.vary
+    assert decode(response) == plain.get_data()
+
+
+def test_streamed_response_is_compressed(client):
+    plain = client.get("/marketapi/v1/networth", headers={"Accept-Encoding": "identity"})
+    response = client.get("/marketapi/v1/networth", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert decode(response) == plain.get_data()
+
+
+def test_each_encoding_has_its_own_etag(client):
+    etags = {
+        client.get(RETIREMENT, headers={"Accept-Encoding": accept_encoding}).headers["ETag"]
+        for accept_encoding in ("identity", "gzip", "br")
+    }
+
+    assert len(etags) == 3
+
+
+@pytest.mark.parametrize("size, compressed", [
+    (main._COMPRESS_MIN_BYTES - 1, False),
+    (main._COMPRESS_MIN_BYTES, True),
+])
+def test_small_bodies_are_sent_uncompressed(size, compressed):
+    body = b'"' + b"x" * (size - 2) + b'"'
+    with main.app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        response = main._compress_response(Response(body, mimetype="application/json"))
+
+    assert ("Content-Encoding" in response.headers) is compressed
+    assert "Accept-Encoding" in response.vary
+    assert decode(response) == body
+
+
+def test_errors_and_non_json_are_left_alone():
+    with main.app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        error = main._compress_response(
+            Response(b"{}" * 1024, status=500, mimetype="application/json")
+        )
+        html = main._compress_response(Response(b"<p>" * 1024, mimetype="text/html"))
+
+    assert "Content-Encoding" not in error.headers
+    assert "Content-Encoding" not in html.headers
@@ -0,0 +1,106 @@
+"""
+Tests for the in-process net worth dataset cache in services.google_sheets.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import services.google_sheets as google_sheets
+from services.google_sheets import get_cached_net_worth_dataset
+
+DEFAULT_KEY = (None, None)
+
+
+def test_loads_and_parses_the_sheet(sheets):
+    dataset = get_cached_net_worth_dataset()
+
+    assert sheets.calls == 1
+    assert [entry.date for entry in dataset.entries] == [
+        date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)
+    ]
+    assert dataset.get_latest_entry().notes == "latest"
+
+
+def test_fresh_dataset_is_reused(sheets):
+    first = get_cached_net_worth_dataset()
+    second = get_cached_net_worth_dataset()
+
+    assert second is first
+    assert sheets.calls == 1
+
+
+def test_concurrent_callers_share_one_load(sheets):
+    sheets.gate.clear()
+    callers = 8
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        results = [pool.submit(get_cached_net_worth_dataset) for _ in range(callers)]
+        assert sheets.started.wait(timeout=5)
+        # Give the other callers time to queue up behind the in-flight load
+        time.sleep(0.1)
+        sheets.gate.set()
+        datasets = [result.result(timeout=5) for result in results]
+
+    assert sheets.calls == 1
+    assert all(dataset is datasets[0] for dataset in datasets)
+
+
+def test_stale_dataset_is_served_while_refreshing(sheets):
+    stale = get_cached_net_worth_dataset()
+    loaded_at, dataset = google_sheets._dataset_cache[DEFAULT_KEY]
+    google_sheets._dataset_cache[DEFAULT_KEY] = (loaded_at - 10, dataset)
+    sheets.started.clear()
+    sheets.gate.clear()
+
+    # Past the TTL but within the stale window: answered from the cache
+    # without waiting on the refresh it starts
+    served = get_cached_net_worth_dataset(ttl=1, stale_ttl=1000)
+    assert served is stale
+    assert sheets.started.wait(timeout=5)
+    refresh = google_sheets._dataset_loads[DEFAULT_KEY]
+
+    # Callers arriving during the refresh get the stale copy too, and
+    # join the refresh already running instead of starting another
+    assert get_cached_net_worth_dataset(ttl=1, stale_ttl=1000) is stale
+
+    sheets.gate.set()
+    fresh = refresh.result(timeout=5)
+
+    assert fresh is not stale
+    assert sheets.calls == 2
+    assert get_cached_net_worth_dataset(ttl=1, stale_ttl=1000) is fresh
+
+
+def test_zero_ttl_forces_a_load(sheets):
+    first = get_cached_net_worth_dataset()
+    forced = get_cached_net_worth_dataset(ttl=0, stale_ttl=0)
+
+    assert forced is not first
+    assert sheets.calls == 2
+
+
+def test_refresh_query_forces_a_load(client, sheets):
+    assert client.get("/marketapi/v1/networth/summary").status_code == 200
+    assert client.get("/marketapi/v1/networth/summary").status_code == 200
+    assert sheets.calls == 1
+
+    response = client.get("/marketapi/v1/networth/summary?refresh=true")
+
+    assert response.status_code == 200
+    assert sheets.calls == 2
+
+
+def test_sheets_client_is_reused_across_loads(sheets, monkeypatch):
+    created = []
+    original_init = google_sheets.GoogleSheetsService.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(google_sheets.GoogleSheetsService, "__init__", counting_init)
+    get_cached_net_worth_dataset()
+    get_cached_net_worth_dataset(ttl=0, stale_ttl=0)
+
+    assert sheets.calls == 2
+    assert len(created) == 1
@@ -0,0 +1,63 @@
+"""
+Tests for the M4 downsampling used by the timeseries chart endpoint.
+"""
+
+import random
+
+from main import _m4_indices
+
+
+def bucket_of(x, xs, width):
+    span = (xs[-1] - xs[0]) or 1
+    return min(width - 1, (x - xs[0]) * width // span)
+
+
+def test_keeps_first_last_min_and_max_of_every_bucket():
+    rng = random.Random(4)
+    xs = sorted(rng.sample(range(10_000), 2_000))
+    columns = [
+        [rng.uniform(-1000, 1000) for _ in xs],
+        [None if rng.random() < 0.2 else rng.uniform(0, 50) for _ in xs],
+    ]
+    width = 37
+
+    keep = set(_m4_indices(xs, columns, width))
+
+    buckets = {}
+    for i, x in enumerate(xs):
+        buckets.setdefault(bucket_of(x, xs, width), []).append(i)
+    for indices in buckets.values():
+        assert indices[0] in keep
+        assert indices[-1] in keep
+        for column in columns:
+            present = [i for i in indices if column[i] is not None]
+            if present:
+                assert min(present, key=column.__getitem__) in keep
+                assert max(present, key=column.__getitem__) in keep
+
+
+def test_result_is_sorted_unique_and_bounded():
+    xs = list(range(1_000))
+    columns = [[(i * 7919) % 1013 for i in xs]]
+    width = 20
+
+    keep = _m4_indices(xs, columns, width)
+
+    assert keep == sorted(set(keep))
+    assert keep[0] == 0
+    assert keep[-1] == len(xs) - 1
+    assert len(keep) <= 4 * width
+
+
+def test_keeps_a_single_spike():
+    xs = list(range(500))
+    column = [1.0] * 500
+    column[251] = 99.0
+
+    assert 251 in _m4_indices(xs, [column], 10)
+
+
+def test_all_none_column_keeps_bucket_edges_only():
+    xs = list(range(100))
+
+    assert _m4_indices(xs, [[None] * 100], 4) == [0, 24, 25, 49, 50, 74, 75, 99]
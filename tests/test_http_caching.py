@@ -0,0 +1,87 @@
+"""
+Tests for the ETag, Last-Modified and 304 handling on the data endpoints.
+"""
+
+import main
+
+SUMMARY = "/marketapi/v1/networth/summary"
+
+
+def test_matching_etag_gets_an_empty_304(client):
+    first = client.get(SUMMARY)
+    assert first.status_code == 200
+    assert first.headers["ETag"]
+    assert first.last_modified is not None
+
+    again = client.get(SUMMARY, headers={"If-None-Match": first.headers["ETag"]})
+
+    assert again.status_code == 304
+    assert again.get_data() == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+
+
+def test_stale_etag_gets_a_full_response(client):
+    response = client.get(SUMMARY, headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.get_json()["success"] is True
+
+
+def test_reload_changes_the_etag(client, sheets):
+    before = client.get(SUMMARY).headers["ETag"]
+    client.get(SUMMARY + "?refresh=true")
+
+    after = client.get(SUMMARY, headers={"If-None-Match": before})
+
+    assert sheets.calls == 2
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before
+
+
+def test_each_path_and_query_has_its_own_etag(client):
+    etags = {
+        client.get(path).headers["ETag"]
+        for path in (
+            SUMMARY,
+            "/marketapi/v1/networth",
+            "/marketapi/v1/networth?latest=true",
+            "/marketapi/v1/networth?start_date=2024-02-01",
+        )
+    }
+
+    assert len(etags) == 4
+
+
+def test_200_and_304_allow_short_private_caching(client):
+    first = client.get(SUMMARY)
+    again = client.get(SUMMARY, headers={"If-None-Match": first.headers["ETag"]})
+
+    assert again.status_code == 304
+    for response in (first, again):
+        assert response.headers["Cache-Control"] == "private, max-age=30"
+
+
+def test_304_varies_on_the_same_headers_as_the_200(client):
+    for accept_encoding in ("identity", "gzip", "br"):
+        headers = {"Accept-Encoding": accept_encoding}
+        first = client.get(SUMMARY, headers=headers)
+        again = client.get(SUMMARY, headers={**headers, "If-None-Match": first.headers["ETag"]})
+
+        assert again.status_code == 304
+        assert {"Accept-Encoding", "Authorization"} <= set(first.vary)
+        assert set(again.vary) == set(first.vary)
+
+
+def test_dashboard_script_is_revalidated_per_encoding(client):
+    path = f"/marketapi/static/dashboard.{main._DASHBOARD_JS_ETAG}.js"
+    first = client.get(path, headers={"Accept-Encoding": "gzip"})
+    again = client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+    other = client.get(path, headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["ETag"]})
+
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert "immutable" in first.headers["Cache-Control"]
+    assert again.status_code == 304
+    assert "Accept-Encoding" in again.vary
+    assert again.headers["Cache-Control"] == first.headers["Cache-Control"]
+    assert other.status_code == 200
+    assert "Content-Encoding" not in other.headers
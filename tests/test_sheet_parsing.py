@@ -0,0 +1,151 @@
+"""
+Tests for GoogleSheetsService cell parsers.
+
+The fast paths added to the parsers must give the same results as the
+original parsers, kept below as reference implementations.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+from services.google_sheets import GoogleSheetsService
+
+
+def baseline_parse_date(value):
+    """_parse_date as it was before the shape classifier and serial fast path."""
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    value_str = str(value).strip()
+    if not value_str:
+        return None
+    formats = [
+        "%Y-%m-%d",
+        "%m/%d/%Y",
+        "%m/%d/%y",
+        "%d/%m/%Y",
+        "%Y/%m/%d",
+        "%B %d, %Y",
+        "%b %d, %Y",
+    ]
+    for fmt in formats:
+        try:
+            return datetime.strptime(value_str, fmt).date()
+        except ValueError:
+            continue
+    try:
+        serial = float(value_str)
+        return date(1899, 12, 30) + timedelta(days=int(serial))
+    except (ValueError, OverflowError):
+        pass
+    return None
+
+
+def baseline_parse_decimal(value):
+    """_parse_decimal as it was before the int/float fast paths."""
+    if value is None or value == "":
+        return None
+    value_str = str(value).strip()
+    if not value_str or value_str.lower() in ("n/a", "-", "—", ""):
+        return None
+    cleaned = value_str.replace("$", "").replace(",", "").replace(" ", "")
+    if cleaned.endswith("%"):
+        cleaned = cleaned[:-1]
+        try:
+            return Decimal(cleaned) / 100
+        except InvalidOperation:
+            pass
+    if cleaned.startswith("(") and cleaned.endswith(")"):
+        cleaned = "-" + cleaned[1:-1]
+    try:
+        return Decimal(cleaned)
+    except InvalidOperation:
+        return None
+
+
+def baseline_parse_int(value):
+    """_parse_int as it was before the numeric fast paths."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(float(str(value).strip()))
+    except (ValueError, TypeError):
+        return None
+
+
+@pytest.fixture
+def service():
+    return GoogleSheetsService(spreadsheet_id="test-sheet")
+
+
+DATE_CELLS = [
+    # Serial numbers, as the SERIAL_NUMBER render option returns them
+    45292, 45292.75, 0.5, -1, "45292", "45292.5", " 45292 ", "-5", "1e3",
+    # Text in each supported format
+    "2024-03-05", "3/5/2024", "03/05/2024", "13/05/2024", "03/05/24",
+    "2024/03/05", "March 5, 2024", "Mar 5, 2024", " 2024-03-05 ",
+    # Invalid dates and other text
+    "2/30/2024", "2024-13-01", "Sept 5, 2024", "garbage", "nan",
+    # Blanks
+    "", "   ", None, 0,
+    date(2024, 3, 3),
+]
+
+DECIMAL_CELLS = [
+    # Numbers, as the UNFORMATTED_VALUE render option returns them
+    1000, -3, 0, 800.5, 0.1, -0.0, 1e20, 1e-7, 1 / 3, float("nan"),
+    float("inf"),
+    # Formatted text
+    "1000", " 1,234.56 ", "$1,234.56", "(42.10)", "12.5%", "-7", "1e3",
+    # Other text
+    "N/A", "-", "—", "abc", "#DIV/0!",
+    # Blanks
+    "", "   ", None, True, False,
+]
+
+INT_CELLS = [
+    # Numbers, as the UNFORMATTED_VALUE render option returns them
+    7, -3, 0, 7.9, -7.9, 1e20, float("nan"),
+    # Numeric text
+    "7", " 7 ", "7.5", "-7.5", "+3", ".5", "5.", "1e2", "1E-2", "-0",
+    # Other text
+    "abc", "#DIV/0!", "1.2.3", "--1", "nan",
+    # Blanks
+    "", "   ", None, True, False,
+]
+
+
+@pytest.mark.parametrize("value", DATE_CELLS, ids=repr)
+def test_parse_date_matches_baseline(service, value):
+    assert service._parse_date(value) == baseline_parse_date(value)
+
+
+@pytest.mark.parametrize("value", INT_CELLS, ids=repr)
+def test_parse_int_matches_baseline(service, value):
+    assert service._parse_int(value) == baseline_parse_int(value)
+
+
+@pytest.mark.parametrize("value", DECIMAL_CELLS, ids=repr)
+def test_parse_decimal_matches_baseline(service, value):
+    # repr tells Decimal("1000") from Decimal("1000.0"), and NaN from NaN
+    assert repr(service._parse_decimal(value)) == repr(baseline_parse_decimal(value))
+
+
+def test_parse_decimal_keeps_the_shortest_float_repr(service):
+    # Decimal(0.1) would carry the float's full binary expansion
+    assert service._parse_decimal(0.1) == Decimal("0.1")
+    assert service._parse_decimal(1000) == Decimal("1000")
+
+
+def test_parse_date_examples(service):
+    assert service._parse_date(45292) == date(2024, 1, 1)
+    assert service._parse_date("13/05/2024") == date(2024, 5, 13)
+    assert service._parse_date("") is None
+
+
+def test_parse_int_rejects_infinity_text(service):
+    # The original parser raised OverflowError here and aborted the load
+    assert service._parse_int("inf") is None